@@ -1,7 +1,9 @@
 import json
 import os
-import re
 import logging
+import threading
+from collections import defaultdict
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -11,9 +13,15 @@ from dotenv import load_dotenv
 
 from src.persistence import load_json_file, save_json_file
 from src.schema_truth import load_schema_truth, canonical_keys
-from src.mapper import suggest_mapping, apply_mapping_overrides
-from src.clean_validate import build_proposed_clean_df
-from src.llm import have_openai_key, propose_schema_for_headers
+from src.mapper import MapEntry, suggest_mapping, apply_mapping_overrides
+from src.clean_validate import IssueLog, build_proposed_clean_df
+from src.llm import have_openai_key, prewarm_connection, propose_schema_for_headers
+from src.llm_batch import (
+	BATCH_HEADER_THRESHOLD,
+	collect_schema_proposals,
+	poll_batch,
+	submit_schema_proposal_batch,
+)
 from src.csv_loader import read_csv_fallback
 from src.logging_utils import setup_logging, set_log_level
 
@@ -61,7 +69,18 @@ def _load_env_once():
 	os.environ["_APP_ENV_LOADED"] = "1"
 
 
+def _prewarm_llm_once():
+	# Warm the API connection in the background so the first LLM call skips
+	# the TCP/TLS handshake; guarded because Streamlit re-executes this
+	# module on every rerun and one prewarm per process is enough
+	if os.environ.get("_APP_LLM_PREWARMED") == "1":
+		return
+	os.environ["_APP_LLM_PREWARMED"] = "1"
+	threading.Thread(target=prewarm_connection, daemon=True).start()
+
+
 _load_env_once()
+_prewarm_llm_once()
 
 st.set_page_config(page_title=APP_TITLE, layout="wide")
 st.title(APP_TITLE)
@@ -99,9 +118,52 @@ if "overrides" not in st.session_state:
 if "schema_changes" not in st.session_state:
 	st.session_state.schema_changes = []
 
+# Cached wrappers: Streamlit reruns the whole script on every widget
+# interaction, so the heavy steps are memoized. Leading-underscore arguments
+# are excluded from the cache key; unhashable inputs (truth with compiled
+# regexes, large DataFrames) are keyed by mtime/fingerprint instead.
+@st.cache_resource(show_spinner=False)
+def _load_truth_cached(path_str: str, mtime: float):
+	return load_schema_truth(Path(path_str))
+
+
+def _df_fingerprint(df: pd.DataFrame):
+	# Hash the full frame: a head-only fingerprint would serve stale cleaning
+	# results for re-uploads that differ beyond the sampled rows. Vectorized
+	# row hashing is microseconds next to the cleaning pass it keys.
+	return (df.shape, tuple(df.columns), pd.util.hash_pandas_object(df, index=True).sum())
+
+
+@st.cache_data(show_spinner=False)
+def _parse_upload(file_name: str, data: bytes):
+	return read_csv_fallback(BytesIO(data))
+
+
+@st.cache_data(show_spinner=False)
+def _suggest_mapping_cached(source_headers: Tuple[str, ...], truth_mtime: float, use_llm: bool, _truth, _synonyms):
+	return suggest_mapping(
+		source_headers=list(source_headers),
+		truth=_truth,
+		learned_synonyms=_synonyms,
+		use_llm=use_llm,
+	)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _df_fingerprint})
+def _build_proposed_cached(raw_df: pd.DataFrame, mapping_result: Dict, truth_mtime: float, use_llm: bool, _truth):
+	return build_proposed_clean_df(
+		raw_df=raw_df,
+		mapping_result=mapping_result,
+		truth=_truth,
+		clean_pack={"value_transforms": _truth.get("value_transforms", {})},
+		use_llm=use_llm,
+	)
+
+
 # Load schema truth only
 try:
-	truth = load_schema_truth(TRUTH_PATH)
+	truth_mtime = TRUTH_PATH.stat().st_mtime if TRUTH_PATH.exists() else 0.0
+	truth = _load_truth_cached(str(TRUTH_PATH), truth_mtime)
 	logger.info("Loaded schema truth: truth_keys=%d", len(canonical_keys(truth)))
 except Exception as e:
 	logger.exception("Failed to load schema truth")
@@ -111,12 +173,19 @@ except Exception as e:
 # Helper to render full-height tables
 TABLE_HEIGHT = 420
 
-def show_df(df: pd.DataFrame, label: str):
+def show_df(df: pd.DataFrame, label: str, sample: int = 1000):
 	st.subheader(label)
+	# Serializing the full frame to the browser dominates rerun latency on
+	# large files; previews render a fixed-size sample (downloads stay full)
+	n = len(df)
+	if n > sample:
+		st.caption(f"Showing {sample:,} of {n:,} rows")
+		df = df.sample(sample, random_state=0).sort_index()
 	st.dataframe(df, use_container_width=True, height=TABLE_HEIGHT, hide_index=True)
 
 with st.expander("Recent logs (session)", expanded=False):
-	logs = st.session_state.get("log_records", [])
+	# log_records is a deque; materialize once per render for slicing
+	logs = list(st.session_state.get("log_records") or ())
 	if logs:
 		st.code("\n".join(logs[-300:]), language="text")
 	else:
@@ -128,7 +197,7 @@ if step == "Upload":
 	if uploader is not None:
 		try:
 			logger.info("Reading uploaded CSV: name=%s size=%d", uploader.name, len(uploader.getvalue()))
-			df, enc, kwargs = read_csv_fallback(uploader)
+			df, enc, kwargs = _parse_upload(uploader.name, uploader.getvalue())
 			logger.info("Parsed CSV with encoding=%s kwargs=%s shape=%s", enc, kwargs, df.shape)
 			st.session_state.raw_df = df
 			st.session_state.mapping_result = None
@@ -164,37 +233,65 @@ elif step == "Mapper":
 	# Use only synonyms from the single truth source
 	merged_synonyms: Dict[str, List[str]] = {k: (v.get("synonyms", []) if isinstance(v, dict) else []) for k, v in truth.items()}
 
-	with st.spinner("Suggesting mapping..."):
-		suggested, unmatched = suggest_mapping(
-			source_headers=source_headers,
-			truth=truth,
-			learned_synonyms=merged_synonyms,
-			use_llm=use_llm,
-		)
-	logger.info("Mapper result: matched=%d unmatched=%d", len(suggested), len(unmatched))
-	st.session_state.mapping_result = suggested
-	st.session_state.unmatched_headers = unmatched
-
-	# LLM proposals for headers that can't map to existing truth
-	mapper_proposals = {}
-	if use_llm and unmatched:
-		try:
-			samples = {h: st.session_state.raw_df[h].dropna().astype(str).head(5).tolist() for h in unmatched if h in st.session_state.raw_df.columns}
-			mapper_proposals = propose_schema_for_headers(unmatched, samples)
-			logger.info("Header proposals generated: %d", len(mapper_proposals))
-		except Exception as e:
-			logger.warning("Header proposal generation failed: %s", e)
-	st.session_state.mapper_proposals = mapper_proposals
+	# Recompute suggestions (and LLM proposals) only when the inputs changed;
+	# unrelated widget interactions reuse the session-state results
+	mapper_key = (id(st.session_state.raw_df), tuple(source_headers), truth_mtime)
+	if st.session_state.mapping_result is None or st.session_state.get("_mapper_key") != mapper_key:
+		with st.spinner("Suggesting mapping..."):
+			suggested, unmatched = _suggest_mapping_cached(
+				tuple(source_headers), truth_mtime, use_llm, truth, merged_synonyms
+			)
+		logger.info("Mapper result: matched=%d unmatched=%d", len(suggested), len(unmatched))
+		st.session_state.mapping_result = suggested
+		st.session_state.unmatched_headers = unmatched
+
+		# LLM proposals for headers that can't map to existing truth. Very large
+		# header sets go through the Batch API (cheaper, separate rate limits)
+		# and are collected by polling below instead of blocking the rerun.
+		mapper_proposals = {}
+		if use_llm and unmatched:
+			try:
+				samples = {h: st.session_state.raw_df[h].dropna().astype(str).head(5).tolist() for h in unmatched if h in st.session_state.raw_df.columns}
+				if len(unmatched) > BATCH_HEADER_THRESHOLD and have_openai_key():
+					st.session_state.proposal_batch_id = submit_schema_proposal_batch(unmatched, samples)
+					logger.info("Submitted proposal batch %s for %d headers", st.session_state.proposal_batch_id, len(unmatched))
+				else:
+					mapper_proposals = propose_schema_for_headers(unmatched, samples)
+					logger.info("Header proposals generated: %d", len(mapper_proposals))
+			except Exception as e:
+				logger.warning("Header proposal generation failed: %s", e)
+		st.session_state.mapper_proposals = mapper_proposals
+		st.session_state._mapper_key = mapper_key
+	else:
+		suggested = st.session_state.mapping_result
+		unmatched = st.session_state.unmatched_headers
+
+	# Poll a pending proposal batch (submitted for very large header sets)
+	if st.session_state.get("proposal_batch_id"):
+		batch_id = st.session_state.proposal_batch_id
+		st.info(f"Schema proposal batch pending: {batch_id}")
+		if st.button("Check proposal batch status"):
+			try:
+				merged = collect_schema_proposals(batch_id)
+				if merged is None:
+					st.write(f"Batch status: {poll_batch(batch_id)}")
+				else:
+					st.session_state.mapper_proposals = merged
+					st.session_state.proposal_batch_id = None
+					st.success(f"Collected {len(merged)} proposals from batch.")
+			except Exception as e:
+				logger.warning("Proposal batch polling failed: %s", e)
+				st.error(f"Failed to poll proposal batch: {e}")
 
 	# Overrides UI
 	st.markdown("### Review and override mappings")
 	canon_options = ["— Ignore —"] + canonical_keys(truth)
 	override_cols = {}
 	for src in source_headers:
-		row = suggested.get(src, {"canonical": None, "confidence": 0.0})
+		row = suggested.get(src) or MapEntry(canonical=None, confidence=0.0, method="unmapped")
 		default_idx = 0
-		if row.get("canonical") in canon_options:
-			default_idx = canon_options.index(row["canonical"]) if row["canonical"] else 0
+		if row.canonical in canon_options:
+			default_idx = canon_options.index(row.canonical) if row.canonical else 0
 		cols = st.columns([4, 3, 2, 3])
 		with cols[0]:
 			st.write(f"Source: **{src}**")
@@ -206,7 +303,7 @@ elif step == "Mapper":
 				key=f"ovr_{src}",
 			)
 		with cols[2]:
-			st.write(f"Suggested: {row.get('canonical') or '—'}")
+			st.write(f"Suggested: {row.canonical or '—'}")
 		with cols[3]:
 			if src in st.session_state.mapper_proposals:
 				meta = st.session_state.mapper_proposals[src]
@@ -252,8 +349,7 @@ elif step == "Mapper":
 	# Display mapping summary
 	if st.session_state.mapping_result:
 		map_df = pd.DataFrame([
-			{"source": s, "canonical": v.get("canonical"), "confidence": v.get("confidence", 0.0), "method": v.get("method")}
-			for s, v in st.session_state.mapping_result.items()
+			{"source": s, **v.to_dict()} for s, v in st.session_state.mapping_result.items()
 		])
 		st.dataframe(map_df, use_container_width=True, height=TABLE_HEIGHT)
 
@@ -269,21 +365,25 @@ elif step == "Clean/Validate":
 		st.stop()
 
 	use_llm_clean = True
-	logger.info("Clean/Validate start: rows=%d use_llm=%s", len(st.session_state.raw_df), use_llm_clean)
 	if not have_openai_key():
 		st.info("OpenAI key not detected. Deterministic cleaning only.")
 
-	with st.spinner("Building proposed cleaned DataFrame and collecting issues..."):
-		proposed_df, issues = build_proposed_clean_df(
-			raw_df=st.session_state.raw_df,
-			mapping_result=st.session_state.mapping_result,
-			truth=truth,
-			clean_pack={"value_transforms": truth.get("value_transforms", {})},
-			use_llm=use_llm_clean,
-		)
-	logger.info("Clean/Validate produced: proposed_shape=%s issues=%d", proposed_df.shape, len(issues))
-	st.session_state.proposed_df = proposed_df
-	st.session_state.issues = issues
+	# Heavy work fires only on explicit request, not on every rerun of this step
+	if st.button("Run Clean/Validate") or st.session_state.proposed_df is None:
+		logger.info("Clean/Validate start: rows=%d use_llm=%s", len(st.session_state.raw_df), use_llm_clean)
+		with st.spinner("Building proposed cleaned DataFrame and collecting issues..."):
+			proposed_df, issues = _build_proposed_cached(
+				st.session_state.raw_df,
+				st.session_state.mapping_result,
+				truth_mtime,
+				use_llm_clean,
+				truth,
+			)
+		logger.info("Clean/Validate produced: proposed_shape=%s issues=%d", proposed_df.shape, len(issues))
+		st.session_state.proposed_df = proposed_df
+		st.session_state.issues = issues
+	else:
+		issues = st.session_state.issues
 
 	# Show before/after
 	tabs = st.tabs(["Before (Raw)", "Proposed (Not Applied)", "Issues Found"])
@@ -293,8 +393,7 @@ elif step == "Clean/Validate":
 		show_df(st.session_state.proposed_df, "Proposed Cleaned (Preview)")
 	with tabs[2]:
 		if issues:
-			issues_df = pd.DataFrame(issues)
-			st.dataframe(issues_df, use_container_width=True, height=TABLE_HEIGHT)
+			st.dataframe(issues.to_frame(), use_container_width=True, height=TABLE_HEIGHT)
 		else:
 			st.success("No issues detected.")
 
@@ -304,35 +403,47 @@ elif step == "Targeted Fixes":
 		st.warning("Run Clean/Validate first.")
 		st.stop()
 
-	issues = st.session_state.issues or []
+	issues = st.session_state.issues or IssueLog()
 	logger.info("Targeted Fixes: issues=%d", len(issues))
 	if not issues:
 		st.info("No pending issues. You can export the proposed file.")
 		st.session_state.final_df = st.session_state.proposed_df.copy()
 	else:
 		st.subheader("Review issues and apply suggestions")
-		issues_df = pd.DataFrame(issues)
-		st.dataframe(issues_df, use_container_width=True, height=TABLE_HEIGHT)
-		count_suggestions = sum(1 for i in issues if i.get("suggestion") is not None and i.get("row_index") is not None)
+		st.dataframe(issues.to_frame(), use_container_width=True, height=TABLE_HEIGHT)
+		count_suggestions = sum(
+			1 for r, s in zip(issues.row_index, issues.suggestion) if r is not None and s is not None
+		)
 		st.write(f"Suggestions available: {count_suggestions}")
 		if st.button("Apply all suggested fixes"):
 			final_df = st.session_state.proposed_df.copy()
+			# One vectorized assignment per column instead of an .at write per fix
+			fix_df = pd.DataFrame({
+				"row_index": issues.row_index,
+				"column": issues.column,
+				"suggestion": issues.suggestion,
+			})
+			fix_df = fix_df[
+				fix_df["row_index"].notna()
+				& fix_df["suggestion"].notna()
+				& fix_df["column"].isin(final_df.columns)
+			]
 			applied = 0
-			for issue in issues:
-				row_idx = issue.get("row_index")
-				col = issue.get("column")
-				sugg = issue.get("suggestion")
-				if row_idx is not None and col in final_df.columns and sugg is not None:
-					try:
-						final_df.at[row_idx, col] = sugg
-						applied += 1
-					except Exception:
-						pass
+			for col, grp in fix_df.groupby("column"):
+				try:
+					final_df.loc[grp["row_index"].to_numpy(), col] = grp["suggestion"].to_numpy()
+					applied += len(grp)
+				except Exception:
+					pass
 			st.session_state.final_df = final_df
 			st.success(f"Applied {applied} fixes.")
 
 	# New header proposals consolidated accept (from Clean/Validate stage)
-	proposals = [iss for iss in issues if iss.get("reason") == "New header proposal" and iss.get("proposal")]
+	proposals = [
+		{"column": c, "proposal": p}
+		for c, r, p in zip(issues.column, issues.reason, issues.proposal)
+		if r == "New header proposal" and p
+	]
 	if proposals:
 		st.markdown("### New header proposals")
 		st.dataframe(pd.DataFrame([
@@ -362,27 +473,28 @@ elif step == "Targeted Fixes":
 
 	# Consolidated promotions directly into schema truth
 	st.markdown("### Promote improvements (one-click)")
-	candidate_synonyms: Dict[str, List[str]] = {}
+	candidate_synonyms: Dict[str, set] = defaultdict(set)
 	mapped = st.session_state.mapping_result or {}
 	for src, row in mapped.items():
-		canon = row.get("canonical")
+		canon = row.canonical
 		if not canon:
 			continue
 		if src.strip().lower() == canon.strip().lower():
 			continue
-		candidate_synonyms.setdefault(canon, [])
-		if src not in candidate_synonyms[canon]:
-			candidate_synonyms[canon].append(src)
-
-	candidate_transforms: Dict[str, List[Dict[str, str]]] = {}
-	for issue in issues:
-		sugg = issue.get("suggestion")
-		col = issue.get("column")
-		val = issue.get("value")
+		candidate_synonyms[canon].add(src)
+
+	candidate_transforms: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+	seen_transforms: set = set()
+	for col, val, sugg in zip(issues.column, issues.value, issues.suggestion):
 		if sugg is not None and col:
-			candidate_transforms.setdefault(col, [])
-			pattern = re.escape(str(val)) if val is not None else ""
-			candidate_transforms[col].append({"pattern": pattern, "suggest": str(sugg)})
+			# Transforms only ever match whole values, so store the literal
+			# instead of paying re.escape per issue
+			literal = str(val) if val is not None else ""
+			key = (col, literal, str(sugg))
+			if key in seen_transforms:
+				continue
+			seen_transforms.add(key)
+			candidate_transforms[col].append({"literal": literal, "suggest": str(sugg)})
 
 	cols = st.columns(2)
 	with cols[0]:
@@ -397,9 +509,12 @@ elif step == "Targeted Fixes":
 		for canon, syns in candidate_synonyms.items():
 			truth_data.setdefault(canon, {})
 			existing = truth_data[canon].get("synonyms", []) or []
-			for s in syns:
-				if s.lower() not in [x.lower() for x in existing]:
+			existing_lc = {x.lower() for x in existing}
+			for s in sorted(syns):
+				lc = s.lower()
+				if lc not in existing_lc:
 					existing.append(s)
+					existing_lc.add(lc)
 					changes.append({"action": "promote_synonym", "canonical": canon, "synonym": s})
 			truth_data[canon]["synonyms"] = existing
 		# Record value transforms at top-level
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 from dateutil import parser as dateparser
 
+from .mapper import MapEntry
 from .schema_truth import SchemaTruth
-from .llm import clean_value_with_llm, propose_schema_for_headers
+from .llm import clean_value_batches, propose_schema_for_headers
 
 
 @dataclass
@@ -21,7 +26,81 @@ class CleanResult:
 	extra: Dict[str, Any] | None = None
 
 
-NUM_STRIP_RE = re.compile(r"[ ,\t\n\r\f\v]")
+class IssueLog:
+	"""Columnar store for validation issues (struct-of-arrays).
+
+	Appending to parallel lists avoids a dict allocation per issue, and the
+	issues table materializes with one columnar pd.DataFrame call instead of
+	re-parsing a schema from every record.
+	"""
+
+	__slots__ = ("row_index", "column", "value", "reason", "suggestion", "proposal")
+
+	def __init__(self) -> None:
+		self.row_index: List[Any] = []
+		self.column: List[str | None] = []
+		self.value: List[Any] = []
+		self.reason: List[str | None] = []
+		self.suggestion: List[Any] = []
+		self.proposal: List[Dict | None] = []
+
+	def add(
+		self,
+		row_index: Any = None,
+		column: str | None = None,
+		value: Any = None,
+		reason: str | None = None,
+		suggestion: Any = None,
+		proposal: Dict | None = None,
+	) -> None:
+		self.row_index.append(row_index)
+		self.column.append(column)
+		self.value.append(value)
+		self.reason.append(reason)
+		self.suggestion.append(suggestion)
+		self.proposal.append(proposal)
+
+	def add_many(
+		self,
+		row_indices: List[Any],
+		column: str,
+		values: List[Any],
+		reason: str,
+		suggestions: List[Any] | None = None,
+	) -> None:
+		n = len(row_indices)
+		self.row_index.extend(row_indices)
+		self.column.extend([column] * n)
+		self.value.extend(values)
+		self.reason.extend([reason] * n)
+		self.suggestion.extend(suggestions if suggestions is not None else [None] * n)
+		self.proposal.extend([None] * n)
+
+	def __len__(self) -> int:
+		return len(self.column)
+
+	def __bool__(self) -> bool:
+		return bool(self.column)
+
+	def to_frame(self) -> pd.DataFrame:
+		data = {
+			"row_index": self.row_index,
+			"column": self.column,
+			"value": self.value,
+			"reason": self.reason,
+		}
+		# Optional columns appear only when at least one issue carries them,
+		# matching the previous ragged list-of-dicts rendering
+		if any(s is not None for s in self.suggestion):
+			data["suggestion"] = self.suggestion
+		if any(p is not None for p in self.proposal):
+			data["proposal"] = self.proposal
+		return pd.DataFrame(data)
+
+
+# One C-level translate pass strips whitespace/thousands separators plus the
+# currency/percent symbols the numeric parsers previously removed one by one
+_NUM_STRIP_TABLE = str.maketrans("", "", " ,\t\n\r\f\v₹%")
 CURRENCY_SYMBOLS = {"₹": "INR", "$": "USD"}
 CURRENCY_SYNONYMS = {"inr": "INR", "rs": "INR", "rupees": "INR", "₹": "INR"}
 EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
@@ -32,6 +111,61 @@ GSTIN_RE = re.compile(r"^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}
 PIN6_RE = re.compile(r"^\d{6}$")
 PHONE_CLEAN_RE = re.compile(r"[^0-9+]")
 
+try:  # optional linear-time DFA engine (google-re2) for scalar match paths
+	import re2
+except Exception:
+	re2 = None  # type: ignore
+
+
+def _match_fn(compiled: re.Pattern):
+	"""Bind a .match callable once at import, preferring re2's DFA when installed.
+
+	The pandas vectorized cleaners keep the stdlib patterns (Series.str.match
+	requires re.Pattern); these bound methods serve the scalar per-cell paths.
+	"""
+	if re2 is not None:
+		try:
+			return re2.compile(compiled.pattern).match
+		except Exception:
+			pass
+	return compiled.match
+
+
+ORDER_ID_MATCH = _match_fn(ORDER_ID_RE)
+CUST_ID_MATCH = _match_fn(CUST_ID_RE)
+EMAIL_MATCH = _match_fn(EMAIL_RE)
+
+
+# Fixed-shape ID formats need no regex engine at all on the scalar path:
+# plain character-range compares are several times cheaper per call. The
+# compiled patterns above remain the source of truth for the vectorized path.
+def _is_pin6(s: str) -> bool:
+	return len(s) == 6 and s.isdigit()
+
+
+def _is_sku(s: str) -> bool:
+	return (
+		len(s) == 7
+		and "A" <= s[0] <= "Z"
+		and "A" <= s[1] <= "Z"
+		and s[2] == "-"
+		and s[3:].isdigit()
+	)
+
+
+def _is_gstin(s: str) -> bool:
+	if len(s) != 15:
+		return False
+	return (
+		s[0:2].isdigit()
+		and all("A" <= c <= "Z" for c in s[2:7])
+		and s[7:11].isdigit()
+		and "A" <= s[11] <= "Z"
+		and ("1" <= s[12] <= "9" or "A" <= s[12] <= "Z")
+		and s[13] == "Z"
+		and ("0" <= s[14] <= "9" or "A" <= s[14] <= "Z")
+	)
+
 
 def _strip(value: Any) -> Any:
 	if isinstance(value, str):
@@ -48,10 +182,7 @@ def _to_float(value: Any) -> Tuple[float | None, bool]:
 		except Exception:
 			return None, False
 	if isinstance(value, str):
-		s = value.strip()
-		s = s.replace("%", "")
-		s = s.replace("₹", "")
-		s = NUM_STRIP_RE.sub("", s)
+		s = value.translate(_NUM_STRIP_TABLE)
 		try:
 			return float(s), True
 		except Exception:
@@ -114,175 +245,545 @@ def _normalize_currency(value: Any) -> Tuple[str | None, bool]:
 	return None, False
 
 
-def validate_and_clean(canonical: str, value: Any) -> CleanResult:
-	orig = value
+def _clean_passthrough(value: Any) -> CleanResult:
+	return CleanResult(value, True)
+
+
+def _clean_order_id(value: Any) -> CleanResult:
 	v = _strip(value)
+	if isinstance(v, str):
+		v2 = v.upper()
+		if ORDER_ID_MATCH(v2):
+			return CleanResult(v2, True)
+	return CleanResult(value, False, reason="Invalid order_id format")
 
-	if canonical == "order_id":
-		if isinstance(v, str):
-			v2 = v.upper()
-			if ORDER_ID_RE.match(v2):
-				return CleanResult(v2, True)
-		return CleanResult(orig, False, reason="Invalid order_id format")
-
-	if canonical == "order_date":
-		parsed, ok = _parse_date(v)
-		if ok and parsed:
-			return CleanResult(parsed, True)
-		return CleanResult(orig, False, reason="Unparseable date")
-
-	if canonical == "customer_id":
-		if isinstance(v, str):
-			v2 = v.upper().replace(" ", "")
-			if CUST_ID_RE.match(v2):
-				return CleanResult(v2, True)
-		return CleanResult(orig, False, reason="Invalid customer_id format")
-
-	if canonical == "customer_name":
-		if isinstance(v, str):
-			return CleanResult(v.strip(), True)
-		return CleanResult(orig, True)
-
-	if canonical == "email":
-		if isinstance(v, str):
-			s = v.replace(" ", "")
-			if EMAIL_RE.match(s):
-				return CleanResult(s, True)
-			# If value looks like a phone (7+ digits) treat as misplaced phone
-			if re.search(r"\d{7,}", s):
-				return CleanResult(None, False, reason="Phone found in email field")
-		return CleanResult(None, False, reason="Invalid email")
-
-	if canonical == "phone":
-		if isinstance(v, str):
-			s = PHONE_CLEAN_RE.sub("", v)
-			digits_only = re.sub(r"[^0-9]", "", s)
-			# If value contains an email, mark as misplaced email and clear phone
-			if "@" in v:
-				return CleanResult(None, False, reason="Email found in phone field")
-			# Consider valid if at least 7 digits present
-			if len(digits_only) >= 7:
-				return CleanResult(s, True)
-			return CleanResult(None, False, reason="Invalid phone")
-		return CleanResult(orig, True)
-
-	if canonical in {"billing_address", "shipping_address", "city", "state", "country", "product_name", "category", "subcategory"}:
-		if isinstance(v, str):
-			return CleanResult(v.strip(), True)
-		return CleanResult(orig, True)
-
-	if canonical == "postal_code":
-		# ints/floats
-		if isinstance(v, (int, float)) and not (isinstance(v, float) and pd.isna(v)):
-			try:
-				n = int(round(float(v)))
-				if 0 <= n <= 999999:
-					return CleanResult(f"{n:06d}", True)
-			except Exception:
-				pass
-		if isinstance(v, str):
-			s = v.replace(" ", "")
-			if PIN6_RE.match(s):
-				return CleanResult(s, True)
-			# Suggest digits-only if that yields 6 digits
-			ds = re.sub(r"\D", "", s)
-			if len(ds) == 6:
-				return CleanResult(orig, False, reason="Postal code must be 6 digits", suggestion=ds)
-		return CleanResult(orig, False, reason="Postal code must be 6 digits")
-
-	if canonical == "product_sku":
-		if isinstance(v, str):
-			s = v.upper().strip()
-			if SKU_RE.match(s):
-				return CleanResult(s, True)
-		return CleanResult(orig, False, reason="Invalid SKU format")
-
-	if canonical == "quantity":
-		iv, ok = _to_int(v)
-		if ok and iv is not None and iv >= 0:
-			return CleanResult(iv, True)
-		return CleanResult(orig, False, reason="Invalid quantity")
-
-	if canonical == "unit_price":
-		fv, ok = _to_float(v)
-		if ok and fv is not None and fv >= 0:
-			return CleanResult(fv, True)
-		return CleanResult(orig, False, reason="Invalid unit_price")
-
-	if canonical == "currency":
-		cv, ok = _normalize_currency(v)
-		if ok and cv:
-			return CleanResult(cv, True)
-		return CleanResult(orig, False, reason="Unknown currency")
-
-	if canonical in {"discount_pct", "tax_pct"}:
-		fv, ok = _to_fraction(v)
-		if ok and fv is not None and 0 <= fv <= 1:
-			return CleanResult(round(fv, 4), True)
-		return CleanResult(orig, False, reason="Invalid percent value")
-
-	if canonical == "shipping_fee":
-		fv, ok = _to_float(v)
-		if ok and fv is not None and fv >= 0:
-			return CleanResult(fv, True)
-		return CleanResult(orig, False, reason="Invalid shipping_fee")
 
-	if canonical == "total_amount":
-		fv, ok = _to_float(v)
+def _clean_order_date(value: Any) -> CleanResult:
+	parsed, ok = _parse_date(_strip(value))
+	if ok and parsed:
+		return CleanResult(parsed, True)
+	return CleanResult(value, False, reason="Unparseable date")
+
+
+def _clean_customer_id(value: Any) -> CleanResult:
+	v = _strip(value)
+	if isinstance(v, str):
+		v2 = v.upper().replace(" ", "")
+		if CUST_ID_MATCH(v2):
+			return CleanResult(v2, True)
+	return CleanResult(value, False, reason="Invalid customer_id format")
+
+
+def _clean_text(value: Any) -> CleanResult:
+	v = _strip(value)
+	if isinstance(v, str):
+		return CleanResult(v.strip(), True)
+	return CleanResult(value, True)
+
+
+def _clean_email(value: Any) -> CleanResult:
+	v = _strip(value)
+	if isinstance(v, str):
+		s = v.replace(" ", "")
+		if EMAIL_MATCH(s):
+			return CleanResult(s, True)
+		# If value looks like a phone (7+ digits) treat as misplaced phone
+		if re.search(r"\d{7,}", s):
+			return CleanResult(None, False, reason="Phone found in email field")
+	return CleanResult(None, False, reason="Invalid email")
+
+
+def _clean_phone(value: Any) -> CleanResult:
+	v = _strip(value)
+	if isinstance(v, str):
+		s = PHONE_CLEAN_RE.sub("", v)
+		digits_only = re.sub(r"[^0-9]", "", s)
+		# If value contains an email, mark as misplaced email and clear phone
+		if "@" in v:
+			return CleanResult(None, False, reason="Email found in phone field")
+		# Consider valid if at least 7 digits present
+		if len(digits_only) >= 7:
+			return CleanResult(s, True)
+		return CleanResult(None, False, reason="Invalid phone")
+	return CleanResult(value, True)
+
+
+def _clean_postal_code(value: Any) -> CleanResult:
+	v = _strip(value)
+	# ints/floats
+	if isinstance(v, (int, float)) and not (isinstance(v, float) and pd.isna(v)):
+		try:
+			n = int(round(float(v)))
+			if 0 <= n <= 999999:
+				return CleanResult(f"{n:06d}", True)
+		except Exception:
+			pass
+	if isinstance(v, str):
+		s = v.replace(" ", "")
+		if _is_pin6(s):
+			return CleanResult(s, True)
+		# Suggest digits-only if that yields 6 digits
+		ds = re.sub(r"\D", "", s)
+		if len(ds) == 6:
+			return CleanResult(value, False, reason="Postal code must be 6 digits", suggestion=ds)
+	return CleanResult(value, False, reason="Postal code must be 6 digits")
+
+
+def _clean_product_sku(value: Any) -> CleanResult:
+	v = _strip(value)
+	if isinstance(v, str):
+		s = v.upper().strip()
+		if _is_sku(s):
+			return CleanResult(s, True)
+	return CleanResult(value, False, reason="Invalid SKU format")
+
+
+def _clean_quantity(value: Any) -> CleanResult:
+	iv, ok = _to_int(_strip(value))
+	if ok and iv is not None and iv >= 0:
+		return CleanResult(iv, True)
+	return CleanResult(value, False, reason="Invalid quantity")
+
+
+def _clean_float_min_zero(reason: str) -> Callable[[Any], CleanResult]:
+	def cleaner(value: Any) -> CleanResult:
+		fv, ok = _to_float(_strip(value))
 		if ok and fv is not None and fv >= 0:
 			return CleanResult(fv, True)
-		return CleanResult(orig, False, reason="Invalid total_amount")
+		return CleanResult(value, False, reason=reason)
 
-	if canonical == "tax_id":
-		if isinstance(v, str):
-			s = v.strip().upper()
-			if GSTIN_RE.match(s):
-				return CleanResult(s, True)
-		return CleanResult(orig, False, reason="Invalid GSTIN format")
+	return cleaner
 
-	return CleanResult(orig, True)
 
+def _clean_currency(value: Any) -> CleanResult:
+	cv, ok = _normalize_currency(_strip(value))
+	if ok and cv:
+		return CleanResult(cv, True)
+	return CleanResult(value, False, reason="Unknown currency")
 
-def _extract_email_from_row(raw_row: pd.Series, helper_cols: List[str]) -> str | None:
-	for col in helper_cols:
-		if col not in raw_row.index:
-			continue
-		val = str(raw_row[col]) if pd.notna(raw_row[col]) else ""
-		val = val.strip()
-		if not val:
-			continue
-		if EMAIL_RE.match(val):
-			return val
-		# find email within text
-		m = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", val)
-		if m:
-			return m.group(0)
-	return None
-
-
-def _extract_phone_from_row(raw_row: pd.Series, helper_cols: List[str]) -> str | None:
-	for col in helper_cols:
-		if col not in raw_row.index:
-			continue
-		val = str(raw_row[col]) if pd.notna(raw_row[col]) else ""
-		val = val.strip()
-		if not val:
+
+def _clean_percent(value: Any) -> CleanResult:
+	fv, ok = _to_fraction(_strip(value))
+	if ok and fv is not None and 0 <= fv <= 1:
+		return CleanResult(round(fv, 4), True)
+	return CleanResult(value, False, reason="Invalid percent value")
+
+
+def _clean_tax_id(value: Any) -> CleanResult:
+	v = _strip(value)
+	if isinstance(v, str):
+		s = v.strip().upper()
+		if _is_gstin(s):
+			return CleanResult(s, True)
+	return CleanResult(value, False, reason="Invalid GSTIN format")
+
+
+# Frozen canonical -> scalar cleaner table; one dict lookup replaces the
+# per-call if/elif chain over every canonical name.
+DISPATCH: Dict[str, Callable[[Any], CleanResult]] = MappingProxyType({
+	"order_id": _clean_order_id,
+	"order_date": _clean_order_date,
+	"customer_id": _clean_customer_id,
+	"customer_name": _clean_text,
+	"email": _clean_email,
+	"phone": _clean_phone,
+	"billing_address": _clean_text,
+	"shipping_address": _clean_text,
+	"city": _clean_text,
+	"state": _clean_text,
+	"country": _clean_text,
+	"product_name": _clean_text,
+	"category": _clean_text,
+	"subcategory": _clean_text,
+	"postal_code": _clean_postal_code,
+	"product_sku": _clean_product_sku,
+	"quantity": _clean_quantity,
+	"unit_price": _clean_float_min_zero("Invalid unit_price"),
+	"currency": _clean_currency,
+	"discount_pct": _clean_percent,
+	"tax_pct": _clean_percent,
+	"shipping_fee": _clean_float_min_zero("Invalid shipping_fee"),
+	"total_amount": _clean_float_min_zero("Invalid total_amount"),
+	"tax_id": _clean_tax_id,
+})
+
+
+def validate_and_clean(canonical: str, value: Any) -> CleanResult:
+	return DISPATCH.get(canonical, _clean_passthrough)(value)
+
+
+# Vectorized column cleaners.
+# Each takes the non-null slice of a canonical column and returns
+# (cleaned_values, valid_mask, reasons, suggestions) where reasons is a shared
+# string or a Series aligned to the input, and suggestions is None or a Series
+# holding per-cell suggestions (NaN where absent). Whole columns are cleaned
+# with a handful of C-level pandas calls instead of one Python call per cell.
+VecResult = Tuple[pd.Series, pd.Series, "pd.Series | str", "pd.Series | None"]
+
+
+try:  # Arrow C++ utf8 kernels (SIMD) for bulk ID-column normalization
+	import pyarrow as pa
+	import pyarrow.compute as pc
+except Exception:
+	pa = None  # type: ignore
+	pc = None  # type: ignore
+
+
+def _as_str(series: pd.Series) -> pd.Series:
+	return series.astype("string")
+
+
+def _arrow_normalize_match(
+	series: pd.Series, pattern: str, remove_spaces: bool = False
+) -> Tuple[pd.Series, pd.Series] | None:
+	"""Trim/upper(/de-space) and regex-match a column through pyarrow.compute.
+
+	Returns (cleaned, valid) aligned to the input index, or None when pyarrow
+	is unavailable or the conversion fails (callers fall back to pandas .str).
+	"""
+	if pc is None:
+		return None
+	try:
+		arr = pa.array(series.astype(str), type=pa.string())
+		arr = pc.utf8_trim_whitespace(arr)
+		if remove_spaces:
+			arr = pc.replace_substring(arr, pattern=" ", replacement="")
+		arr = pc.utf8_upper(arr)
+		mask = pc.match_substring_regex(arr, pattern)
+		cleaned = pd.Series(arr.to_pandas().to_numpy(), index=series.index, dtype="string")
+		valid = pd.Series(mask.to_pandas().to_numpy(), index=series.index).fillna(False).astype(bool)
+		return cleaned, valid
+	except Exception:
+		return None
+
+
+def _mask(series: pd.Series) -> pd.Series:
+	return series.fillna(False).astype(bool)
+
+
+def _where_valid(cleaned: pd.Series, valid: pd.Series, original: pd.Series) -> pd.Series:
+	"""Overlay cleaned values on the valid rows, keeping originals elsewhere.
+
+	Assembled in object space: writing originals back into an extension array
+	with .where raises when they cannot be cast into its dtype (e.g. "N/A"
+	into Int64, or a numeric cell into a StringArray).
+	"""
+	out = original.astype(object)
+	out[valid] = cleaned[valid].astype(object)
+	return out
+
+
+def _valid_or_none(cleaned: pd.Series, valid: pd.Series) -> pd.Series:
+	"""Cleaned values on the valid rows, None elsewhere (for email/phone,
+	which clear invalid cells instead of keeping the original)."""
+	# np.full keeps literal None; pd.Series(None, ...) would broadcast to NaN
+	out = pd.Series(np.full(len(cleaned), None, dtype=object), index=cleaned.index)
+	out[valid] = cleaned[valid].astype(object)
+	return out
+
+
+def _vec_order_id(series: pd.Series) -> VecResult:
+	arrow = _arrow_normalize_match(series, ORDER_ID_RE.pattern)
+	if arrow is not None:
+		s, valid = arrow
+	else:
+		s = _as_str(series).str.strip().str.upper()
+		valid = _mask(s.str.match(ORDER_ID_RE))
+	return _where_valid(s, valid, series), valid, "Invalid order_id format", None
+
+
+def _vec_order_date(series: pd.Series) -> VecResult:
+	# Numeric cells are rejected like the scalar parser does - to_datetime
+	# would read them as epoch nanoseconds and silently accept every row as
+	# 1970-01-01 (routine once the pyarrow engine infers 20250614-style
+	# columns as int64)
+	if pd.api.types.is_numeric_dtype(series):
+		return series.astype(object), pd.Series(False, index=series.index), "Unparseable date", None
+	is_num = series.map(lambda v: isinstance(v, (int, float, np.number))).astype(bool)
+	# pandas' C parser with cache=True dedupes repeated date strings; fall back
+	# to the per-cell dateutil parser only for the slice it could not handle
+	parsed = pd.to_datetime(series.mask(is_num), errors="coerce", dayfirst=True, format="mixed", cache=True)
+	out = parsed.dt.strftime("%Y-%m-%d").copy()
+	missed = out.isna() & ~is_num
+	if missed.any():
+		out.loc[missed] = series[missed].map(lambda v: _parse_date(v)[0])
+	valid = out.notna()
+	return _where_valid(out, valid, series), valid, "Unparseable date", None
+
+
+def _vec_customer_id(series: pd.Series) -> VecResult:
+	arrow = _arrow_normalize_match(series, CUST_ID_RE.pattern, remove_spaces=True)
+	if arrow is not None:
+		s, valid = arrow
+	else:
+		s = _as_str(series).str.upper().str.replace(" ", "", regex=False)
+		valid = _mask(s.str.match(CUST_ID_RE))
+	return _where_valid(s, valid, series), valid, "Invalid customer_id format", None
+
+
+def _vec_text(series: pd.Series) -> VecResult:
+	# Strip strings, pass everything else through untouched - assembled in
+	# object space since writing non-strings back into a StringArray raises
+	is_str = series.map(lambda v: isinstance(v, str)).astype(bool)
+	out = series.astype(object)
+	if is_str.any():
+		out[is_str] = _as_str(series[is_str]).str.strip().astype(object)
+	return out, pd.Series(True, index=series.index), "", None
+
+
+def _vec_email(series: pd.Series) -> VecResult:
+	s = _as_str(series).str.replace(" ", "", regex=False)
+	valid = _mask(s.str.match(EMAIL_RE))
+	phone_like = _mask(s.str.contains(r"\d{7,}", regex=True))
+	reasons = pd.Series(
+		np.where(phone_like, "Phone found in email field", "Invalid email"), index=series.index
+	)
+	return _valid_or_none(s, valid), valid, reasons, None
+
+
+def _vec_phone(series: pd.Series) -> VecResult:
+	# Non-strings pass through untouched, as in the scalar cleaner: a float-
+	# typed phone column would otherwise be stringified as "9876543210.0" and
+	# have the dot stripped into a bogus extra digit
+	is_str = series.map(lambda v: isinstance(v, str)).astype(bool)
+	s = _as_str(series)
+	cleaned = s.str.replace(PHONE_CLEAN_RE, "", regex=True)
+	has_email = _mask(s.str.contains("@", regex=False))
+	digits_ok = _mask(cleaned.str.count(r"[0-9]") >= 7)
+	valid = (digits_ok & ~has_email & is_str) | ~is_str
+	reasons = pd.Series(
+		np.where(has_email, "Email found in phone field", "Invalid phone"), index=series.index
+	)
+	out = _valid_or_none(cleaned, valid & is_str)
+	out[~is_str] = series[~is_str]
+	return out, valid, reasons, None
+
+
+def _vec_postal_code(series: pd.Series) -> VecResult:
+	s = _as_str(series).str.replace(" ", "", regex=False)
+	valid = _mask(s.str.match(PIN6_RE))
+	cleaned = _where_valid(s, valid, series)
+	# Only numeric-typed columns (e.g. 560001.0 from a float64 column) are
+	# zero-padded; short postal *strings* stay flagged as issues, as in the
+	# scalar cleaner
+	if pd.api.types.is_numeric_dtype(series):
+		nums = pd.to_numeric(s, errors="coerce")
+		numeric_ok = _mask(
+			nums.notna() & (nums >= 0) & (nums <= 999999) & (nums == nums.round())
+		)
+		rescue = numeric_ok & ~valid
+		if rescue.any():
+			zfilled = nums[rescue].astype("int64").astype(str).str.zfill(6)
+			cleaned[rescue] = zfilled.astype(object)
+		valid = valid | numeric_ok
+	# Suggest digits-only when stripping non-digits yields exactly 6 digits
+	digits = s.str.replace(r"\D", "", regex=True)
+	suggestions = digits.where(~valid & _mask(digits.str.len() == 6))
+	return cleaned, valid, "Postal code must be 6 digits", suggestions
+
+
+def _vec_product_sku(series: pd.Series) -> VecResult:
+	arrow = _arrow_normalize_match(series, SKU_RE.pattern)
+	if arrow is not None:
+		s, valid = arrow
+	else:
+		s = _as_str(series).str.upper().str.strip()
+		valid = _mask(s.str.match(SKU_RE))
+	return _where_valid(s, valid, series), valid, "Invalid SKU format", None
+
+
+def _vec_quantity(series: pd.Series) -> VecResult:
+	nums = pd.to_numeric(_strip_numeric(series), errors="coerce").astype("Float64").round()
+	valid = _mask(nums.notna() & (nums >= 0))
+	cleaned = series.astype(object)
+	cleaned[valid] = nums[valid].astype("Int64").astype(object)
+	return cleaned, valid, "Invalid quantity", None
+
+
+def _strip_numeric(series: pd.Series) -> pd.Series:
+	return _as_str(series).str.translate(_NUM_STRIP_TABLE)
+
+
+def _vec_float_min_zero(reason: str) -> Callable[[pd.Series], VecResult]:
+	def cleaner(series: pd.Series) -> VecResult:
+		nums = pd.to_numeric(_strip_numeric(series), errors="coerce").astype("Float64")
+		valid = _mask(nums.notna() & (nums >= 0))
+		return _where_valid(nums, valid, series), valid, reason, None
+
+	return cleaner
+
+
+def _vec_currency(series: pd.Series) -> VecResult:
+	s = _as_str(series).str.strip()
+	mapped = s.map(CURRENCY_SYMBOLS).fillna(s.str.lower().map(CURRENCY_SYNONYMS))
+	alpha3 = (s.str.len() == 3) & _mask(s.str.isalpha())
+	mapped = mapped.fillna(s.str.upper().where(alpha3))
+	valid = mapped.notna()
+	return _where_valid(mapped, valid, series), valid, "Unknown currency", None
+
+
+def _vec_percent(series: pd.Series) -> VecResult:
+	s = _as_str(series).str.strip().str.lower()
+	s = s.str.rstrip("%").str.replace(",", "", regex=False)
+	nums = pd.to_numeric(s, errors="coerce").astype("Float64")
+	frac = nums.where(_mask((nums >= 0) & (nums <= 1)), nums / 100.0)
+	valid = _mask(frac.notna() & (frac >= 0) & (frac <= 1))
+	return _where_valid(frac.round(4), valid, series), valid, "Invalid percent value", None
+
+
+def _vec_tax_id(series: pd.Series) -> VecResult:
+	s = _as_str(series).str.strip().str.upper()
+	valid = _mask(s.str.match(GSTIN_RE))
+	return _where_valid(s, valid, series), valid, "Invalid GSTIN format", None
+
+
+VECTOR_CLEANERS: Dict[str, Callable[[pd.Series], VecResult]] = {
+	"order_id": _vec_order_id,
+	"order_date": _vec_order_date,
+	"customer_id": _vec_customer_id,
+	"customer_name": _vec_text,
+	"email": _vec_email,
+	"phone": _vec_phone,
+	"billing_address": _vec_text,
+	"shipping_address": _vec_text,
+	"city": _vec_text,
+	"state": _vec_text,
+	"country": _vec_text,
+	"product_name": _vec_text,
+	"category": _vec_text,
+	"subcategory": _vec_text,
+	"postal_code": _vec_postal_code,
+	"product_sku": _vec_product_sku,
+	"quantity": _vec_quantity,
+	"unit_price": _vec_float_min_zero("Invalid unit_price"),
+	"currency": _vec_currency,
+	"discount_pct": _vec_percent,
+	"tax_pct": _vec_percent,
+	"shipping_fee": _vec_float_min_zero("Invalid shipping_fee"),
+	"total_amount": _vec_float_min_zero("Invalid total_amount"),
+	"tax_id": _vec_tax_id,
+}
+
+
+# Low-cardinality columns: real CSVs repeat a handful of distinct values
+# (currency, geo fields, SKUs), so validation runs over the uniques only
+CATEGORY_CLEAN_COLS = {"currency", "city", "state", "country", "category", "subcategory", "product_sku"}
+
+
+def _clean_via_categories(cleaner: Callable[[pd.Series], VecResult], work: pd.Series) -> VecResult:
+	uniques = pd.Series(work.unique())
+	if len(uniques) >= len(work):
+		return cleaner(work)
+	u_vals, u_valid, u_reasons, u_sugg = cleaner(uniques)
+	cleaned = work.map(dict(zip(uniques, u_vals)))
+	valid = work.map(dict(zip(uniques, u_valid))).astype(bool)
+	reasons = u_reasons if isinstance(u_reasons, str) else work.map(dict(zip(uniques, u_reasons)))
+	suggestions = None if u_sugg is None else work.map(dict(zip(uniques, u_sugg)))
+	return cleaned, valid, reasons, suggestions
+
+
+def _apply_scalar(col: str, series: pd.Series) -> VecResult:
+	"""Fallback for canonicals without a vectorized cleaner."""
+	# Hoist the dispatch lookup out of the per-cell map
+	fn = DISPATCH.get(col, _clean_passthrough)
+	results = series.map(fn)
+	cleaned = results.map(lambda r: r.value)
+	valid = results.map(lambda r: r.valid).astype(bool)
+	reasons = results.map(lambda r: r.reason)
+	suggestions = results.map(lambda r: r.suggestion)
+	return cleaned, valid, reasons, suggestions
+
+
+EMAIL_ANY_RE = re.compile(r"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})")
+
+
+def _first_hit(found: Dict[str, pd.Series], index: pd.Index) -> pd.Series:
+	"""First non-null value per row across the helper columns, in order.
+
+	Plain numpy selection rather than bfill(axis=1): object-dtype bfill
+	triggers the pandas 2.2 downcasting FutureWarning on every run.
+	"""
+	arr = pd.DataFrame(found).to_numpy(dtype=object)
+	present = pd.notna(arr)
+	first = present.argmax(axis=1)
+	vals = arr[np.arange(len(arr)), first]
+	vals[~present.any(axis=1)] = None
+	return pd.Series(vals, index=index, dtype=object)
+
+
+def _derive_email_hints(raw_df: pd.DataFrame, helper_cols: List[str]) -> pd.Series | None:
+	"""Extract an email per row from the helper columns with two vectorized
+	regex passes, preserving the old first-matching-column precedence."""
+	if not helper_cols:
+		return None
+	found = {c: raw_df[c].astype(str).str.extract(EMAIL_ANY_RE, expand=False) for c in helper_cols}
+	return _first_hit(found, raw_df.index)
+
+
+def _derive_phone_hints(raw_df: pd.DataFrame, helper_cols: List[str]) -> pd.Series | None:
+	if not helper_cols:
+		return None
+	found = {}
+	for c in helper_cols:
+		digits = raw_df[c].astype(str).str.replace(r"[^0-9+]", "", regex=True)
+		found[c] = digits.where(digits.str.count(r"[0-9]") >= 7)
+	return _first_hit(found, raw_df.index)
+
+
+def _hint_at(hints: pd.Series | None, idx: Any) -> str | None:
+	if hints is None:
+		return None
+	v = hints.at[idx]
+	return v if isinstance(v, str) and v else None
+
+
+# Compiled clean plans, keyed by a hash of (source->canonical pairs, truth
+# keys). For a known schema the column ordering, duplicate resolution and
+# cleaner dispatch are resolved once and reused by every subsequent upload.
+_PLAN_CACHE: Dict[str, "CleanPlan"] = {}
+
+
+@dataclass
+class CleanPlan:
+	ordered_pairs: List[Tuple[str, str]]
+	canon_order: List[str]
+	cleaners: Dict[str, Callable[[pd.Series], VecResult] | None]
+
+
+def _compile_clean_plan(source_to_canon: Dict[str, str], truth: SchemaTruth) -> CleanPlan:
+	payload = json.dumps(
+		{"cols": list(source_to_canon.items()), "truth": list(truth.keys())}, default=str
+	)
+	key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+	plan = _PLAN_CACHE.get(key)
+	if plan is not None:
+		return plan
+
+	# Handle duplicates: take first occurrence order
+	canon_seen = set()
+	ordered_pairs: List[Tuple[str, str]] = []
+	for s, c in source_to_canon.items():
+		if c in canon_seen:
 			continue
-		digits = re.sub(r"[^0-9+]", "", val)
-		if len(re.sub(r"[^0-9]", "", digits)) >= 7:
-			return digits
-	return None
+		canon_seen.add(c)
+		ordered_pairs.append((s, c))
+
+	canon_order = list(truth.keys())
+	cleaners = {c: VECTOR_CLEANERS.get(c) for c in canon_order}
+	plan = CleanPlan(ordered_pairs=ordered_pairs, canon_order=canon_order, cleaners=cleaners)
+	_PLAN_CACHE[key] = plan
+	return plan
 
 
 def build_proposed_clean_df(
 	raw_df: pd.DataFrame,
-	mapping_result: Dict[str, Dict],
+	mapping_result: Dict[str, MapEntry],
 	truth: SchemaTruth,
 	clean_pack: Dict,
 	use_llm: bool = False,
-) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+) -> Tuple[pd.DataFrame, IssueLog]:
 	# 0) Identify unmapped headers and propose schema (LLM) with sample values
-	mapped_canon = {s: m.get("canonical") for s, m in mapping_result.items() if m.get("canonical")}
+	mapped_canon = {s: m.canonical for s, m in mapping_result.items() if m.canonical}
 	unmapped_headers = [c for c in raw_df.columns if c not in mapped_canon]
 	schema_proposals: Dict[str, Dict] = {}
 	if use_llm and unmapped_headers:
@@ -292,102 +793,117 @@ def build_proposed_clean_df(
 			samples[col] = ser.head(5).tolist()
 		schema_proposals = propose_schema_for_headers(unmapped_headers, samples)
 
-	# 1) Build mapped DataFrame
+	# 1) Build mapped DataFrame from the (cached) compiled plan
 	source_to_canon = {s: m for s, m in mapped_canon.items() if s in raw_df.columns}
-	pairs = list(source_to_canon.items())
-
-	# Handle duplicates: take first occurrence order
-	canon_seen = set()
-	ordered_pairs = []
-	for s, c in pairs:
-		if c in canon_seen:
-			continue
-		canon_seen.add(c)
-		ordered_pairs.append((s, c))
+	plan = _compile_clean_plan(source_to_canon, truth)
 
 	mapped = {}
-	for src, canon in ordered_pairs:
+	for src, canon in plan.ordered_pairs:
 		mapped[canon] = raw_df[src]
 	mapped_df = pd.DataFrame(mapped)
 
 	# 2) Ensure canonical column order and include missing columns as empty
-	canon_order = list(truth.keys())
+	canon_order = plan.canon_order
 	for c in canon_order:
 		if c not in mapped_df.columns:
 			mapped_df[c] = None
 	cols_in_order = [c for c in canon_order if c in mapped_df.columns]
 	proposed = mapped_df[cols_in_order].copy()
 
-	issues: List[Dict[str, Any]] = []
+	issues = IssueLog()
 
-	# 2.5) Prepare helper columns for extraction (email/phone hints)
+	# 2.5) Derive email/phone hints once over the whole raw_df; issue rows then
+	# look them up by index instead of rebuilding a Series per raw_df.loc call
 	helper_cols = [c for c in raw_df.columns if any(k in c.lower() for k in ["contact", "mobile", "phone", "email", "e-mail"]) ]
+	derived_email = _derive_email_hints(raw_df, helper_cols)
+	derived_phone = _derive_phone_hints(raw_df, helper_cols)
+
+	# Per-column LLM clean batches, gathered and run concurrently at the end
+	llm_batches: List[Tuple[str, List[str], str]] = []
+	llm_fill: List[List[Tuple[int, str]]] = []
 
-	# 3) Validate and perform deterministic normalization
+	# 3) Validate and perform deterministic normalization, one column at a time
 	for col in cols_in_order:
 		series = proposed[col]
-		new_values = []
-		for idx, val in series.items():
-			# Null/missing
-			if val is None or (isinstance(val, float) and pd.isna(val)) or (isinstance(val, str) and val.strip() == ""):
-				new_values.append(val)
-				# Try derive suggestions for specific columns
+
+		# Classify nulls/empties once per column instead of per cell and append
+		# the whole null slice to the issue log in one bulk extend
+		null_mask = series.isna() | _mask(_as_str(series).str.strip() == "")
+		null_arr = null_mask.to_numpy()
+		if null_arr.any():
+			null_idx = series.index.to_numpy()[null_arr]
+			null_vals = series.to_numpy()[null_arr]
+			if col == "email":
+				suggs = [_hint_at(derived_email, idx) for idx in null_idx]
+			elif col == "phone":
+				suggs = [_hint_at(derived_phone, idx) for idx in null_idx]
+			else:
+				suggs = None
+			issues.add_many(null_idx.tolist(), col, null_vals.tolist(), "Null or empty", suggs)
+
+		work = series[~null_mask]
+		if work.empty:
+			continue
+		cleaner = plan.cleaners.get(col)
+		if cleaner is not None:
+			if col in CATEGORY_CLEAN_COLS:
+				cleaned, valid, reasons, suggestions = _clean_via_categories(cleaner, work)
+			else:
+				cleaned, valid, reasons, suggestions = cleaner(work)
+		else:
+			cleaned, valid, reasons, suggestions = _apply_scalar(col, work)
+
+		out = series.astype(object)
+		out.loc[work.index] = cleaned.astype(object)
+		proposed[col] = out
+
+		# Collect issues only for the invalid slice, via numpy views
+		bad_arr = (~valid).to_numpy()
+		if not bad_arr.any():
+			continue
+		bad_idx = work.index.to_numpy()[bad_arr]
+		bad_vals = work.to_numpy()[bad_arr]
+		reason_arr = None if isinstance(reasons, str) else reasons.to_numpy()[bad_arr]
+		sugg_arr = None if suggestions is None else suggestions.to_numpy()[bad_arr]
+		pending_llm: List[Tuple[int, str]] = []
+		for i, (idx, val) in enumerate(zip(bad_idx, bad_vals)):
+			reason = reasons if reason_arr is None else reason_arr[i]
+			sugg = None
+			if sugg_arr is not None and pd.notna(sugg_arr[i]):
+				sugg = sugg_arr[i]
+			if sugg is None:
 				if col == "email":
-					sugg = _extract_email_from_row(raw_df.loc[idx], helper_cols)
-					issue = {"row_index": idx, "column": col, "value": val, "reason": "Null or empty"}
-					if sugg:
-						issue["suggestion"] = sugg
-					issues.append(issue)
-					continue
-				if col == "phone":
-					sugg = _extract_phone_from_row(raw_df.loc[idx], helper_cols)
-					issue = {"row_index": idx, "column": col, "value": val, "reason": "Null or empty"}
-					if sugg:
-						issue["suggestion"] = sugg
-					issues.append(issue)
-					continue
-				issues.append({"row_index": idx, "column": col, "value": val, "reason": "Null or empty"})
-				continue
-			res = validate_and_clean(col, val)
-			new_values.append(res.value)
-			if not res.valid:
-				issue = {"row_index": idx, "column": col, "value": val, "reason": res.reason}
-				if res.suggestion is not None:
-					issue["suggestion"] = res.suggestion
-				else:
-					if col == "email":
-						alt = _extract_email_from_row(raw_df.loc[idx], helper_cols)
-						if alt:
-							issue["suggestion"] = alt
-					elif col == "phone":
-						alt = _extract_phone_from_row(raw_df.loc[idx], helper_cols)
-						if alt:
-							issue["suggestion"] = alt
-					elif use_llm:
-						sugg = clean_value_with_llm(col, str(val), truth.get(col, {}).get("description", ""))
-						if sugg is not None:
-							issue["suggestion"] = sugg
-				issues.append(issue)
-		proposed[col] = pd.Series(new_values, index=series.index)
+					sugg = _hint_at(derived_email, idx)
+				elif col == "phone":
+					sugg = _hint_at(derived_phone, idx)
+				elif use_llm:
+					pending_llm.append((len(issues), str(val)))
+			issues.add(row_index=idx, column=col, value=val, reason=reason, suggestion=sugg)
+
+		# One batched request covers all distinct failing values in the column;
+		# batches for different columns run concurrently after the loop
+		if pending_llm:
+			desc = truth.get(col, {}).get("description", "")
+			llm_batches.append((col, sorted({v for _, v in pending_llm}), desc))
+			llm_fill.append(pending_llm)
+
+	if llm_batches:
+		for sugg_map, pending in zip(clean_value_batches(llm_batches), llm_fill):
+			for pos, v in pending:
+				issues.suggestion[pos] = sugg_map.get(v)
 
 	# 4) Missing canonical columns summary
 	missing = [c for c in canon_order if c not in proposed.columns]
 	for c in missing:
-		issues.append({"row_index": None, "column": c, "value": None, "reason": "Missing column (unmapped)"})
+		issues.add(column=c, reason="Missing column (unmapped)")
 
 	# 5) Extra columns summary, with schema proposal if any
 	extra_cols = [c for c in raw_df.columns if c not in source_to_canon]
 	for c in extra_cols:
-		issues.append({"row_index": None, "column": c, "value": None, "reason": "Extra column"})
+		issues.add(column=c, reason="Extra column")
 
 	# Attach schema proposals as synthetic issues for user visibility
 	for src, meta in (schema_proposals or {}).items():
-		issues.append({
-			"row_index": None,
-			"column": src,
-			"value": None,
-			"reason": "New header proposal",
-			"proposal": meta,
-		})
+		issues.add(column=src, reason="New header proposal", proposal=meta)
 
 	return proposed, issues
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import codecs
+import csv
 from io import BytesIO
 from typing import Any, Dict, Tuple
 
 import pandas as pd
 
+try:  # optional one-shot encoding detector
+	from charset_normalizer import from_bytes as _cn_from_bytes
+except Exception:
+	_cn_from_bytes = None  # type: ignore
+
+try:  # multithreaded Arrow CSV reader + Arrow-backed columns
+	import pyarrow  # noqa: F401
+	_HAVE_PYARROW = True
+except Exception:
+	_HAVE_PYARROW = False
+
 
 CANDIDATE_ENCODINGS = [
 	"utf-8",
@@ -16,12 +29,75 @@ CANDIDATE_ENCODINGS = [
 	"latin-1",
 ]
 
+_BOM_ENCODINGS = [
+	(codecs.BOM_UTF8, "utf-8-sig"),
+	(codecs.BOM_UTF16_LE, "utf-16"),
+	(codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def _detect_encoding(data: bytes) -> str | None:
+	"""Detect encoding up front (BOM first, then charset-normalizer if installed)."""
+	for bom, enc in _BOM_ENCODINGS:
+		if data.startswith(bom):
+			return enc
+	if _cn_from_bytes is not None:
+		try:
+			best = _cn_from_bytes(data[:65536]).best()
+			if best is not None:
+				return best.encoding
+		except Exception:
+			return None
+	return None
+
+
+def _as_utf8(data: bytes, encoding: str) -> Tuple[bytes, str]:
+	"""Recode non-UTF-8 payloads (e.g. UTF-16) since PyArrow only reads UTF-8."""
+	normalized = encoding.lower().replace("-", "").replace("_", "")
+	if normalized in ("utf8", "utf8sig", "ascii"):
+		return data, encoding
+	return data.decode(encoding).encode("utf-8"), "utf-8"
+
+
+def _sniff_delimiter(data: bytes, encoding: str) -> str | None:
+	try:
+		sample = data[:8192].decode(encoding, errors="replace")
+		return csv.Sniffer().sniff(sample).delimiter
+	except Exception:
+		return None
+
 
 def read_csv_fallback(uploaded_file) -> Tuple[pd.DataFrame, str, Dict[str, Any]]:
-	"""Try multiple encodings and parsing modes to read a CSV from a Streamlit UploadedFile.
-	Returns (df, encoding, kwargs_used). Raises last exception if all attempts fail.
+	"""Read a CSV from a Streamlit UploadedFile with a single detected parse.
+
+	Detects the encoding once (BOM, then charset-normalizer when available) and
+	sniffs the delimiter, so the common case is one pd.read_csv call instead of
+	trialling every encoding/parser combination. The multi-encoding loop is kept
+	as fallback. Returns (df, encoding, kwargs_used). Raises last exception if
+	all attempts fail.
 	"""
 	data = uploaded_file.getvalue()
+
+	detected = _detect_encoding(data)
+	if detected:
+		kwargs: Dict[str, Any] = {}
+		delim = _sniff_delimiter(data, detected)
+		if delim and delim != ",":
+			kwargs["sep"] = delim
+		if _HAVE_PYARROW:
+			try:
+				raw, enc = _as_utf8(data, detected)
+				pa_kwargs = dict(kwargs, engine="pyarrow", dtype_backend="pyarrow")
+				df = pd.read_csv(BytesIO(raw), encoding=enc, **pa_kwargs)
+				return df, detected, pa_kwargs
+			except Exception:
+				pass  # fall back to the C engine below
+		try:
+			df = pd.read_csv(BytesIO(data), encoding=detected, **kwargs)
+			return df, detected, kwargs
+		except Exception:
+			pass  # fall through to the trial loop
+
 	last_exc: Exception | None = None
 	for enc in CANDIDATE_ENCODINGS:
 		for kwargs in ({}, {"sep": None, "engine": "python"}):
@@ -1,44 +1,230 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
+import random
+import threading
 import time
 import logging
-from typing import Dict, List
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 try:
 	from openai import OpenAI
 except Exception:
 	OpenAI = None  # type: ignore
 
+try:
+	from openai import AsyncOpenAI
+except Exception:
+	AsyncOpenAI = None  # type: ignore
+
+from .llm_cache import LLMCache
+
+try:  # faster response parsing; stdlib fallback
+	import orjson
+except Exception:
+	orjson = None  # type: ignore
+
+
+def _loads(text: str):
+	if orjson is not None:
+		return orjson.loads(text)
+	return json.loads(text)
+
 
 MODEL_HEADER = "gpt-4.1"
 MODEL_CLEAN = "gpt-4.1"
 LOGGER = logging.getLogger("llm")
 
+# Upper bound on in-flight async LLM requests
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+
 
 def have_openai_key() -> bool:
 	return bool(os.getenv("OPENAI_API_KEY")) and OpenAI is not None
 
 
+try:
+	import httpx
+except Exception:
+	httpx = None  # type: ignore
+
+# Explicit connection-pool knobs; a shared client keeps TLS sessions warm so
+# each call skips the TCP/TLS handshake paid by a per-call client
+LLM_MAX_CONN = int(os.getenv("LLM_MAX_CONN", "32"))
+LLM_KEEPALIVE = int(os.getenv("LLM_KEEPALIVE", "16"))
+
+_HTTPX_CLIENT = None
+_CLIENT = None
+
+
+def _httpx_limits():
+	return httpx.Limits(max_connections=LLM_MAX_CONN, max_keepalive_connections=LLM_KEEPALIVE)
+
+
 def _client():
+	global _CLIENT, _HTTPX_CLIENT
 	if not have_openai_key():
 		raise RuntimeError("OPENAI_API_KEY not configured or openai not installed")
-	# Set a short timeout to avoid hanging the app
+	if _CLIENT is None:
+		# Short timeout to avoid hanging the app
+		try:
+			if httpx is not None:
+				_HTTPX_CLIENT = httpx.Client(
+					limits=_httpx_limits(), timeout=httpx.Timeout(10.0, connect=3.0)
+				)
+				_CLIENT = OpenAI(http_client=_HTTPX_CLIENT)
+			else:
+				_CLIENT = OpenAI(timeout=10)
+		except Exception:
+			_CLIENT = OpenAI()
+	return _CLIENT
+
+
+def _aclient():
+	"""Build a fresh AsyncOpenAI client for the current event loop.
+
+	Not cached: the pooled connections bind to the running loop, so an
+	instance reused across asyncio.run() invocations fails with 'Event loop
+	is closed' once the first loop ends. Callers must close the client
+	inside the loop that created it.
+	"""
+	if not have_openai_key() or AsyncOpenAI is None:
+		raise RuntimeError("OPENAI_API_KEY not configured or openai not installed")
+	try:
+		if httpx is not None:
+			return AsyncOpenAI(http_client=httpx.AsyncClient(
+				limits=_httpx_limits(), timeout=httpx.Timeout(10.0, connect=3.0)
+			))
+		return AsyncOpenAI(timeout=10)
+	except Exception:
+		return AsyncOpenAI()
+
+
+def prewarm_connection() -> None:
+	"""Open the TCP/TLS connection ahead of the first real call (best effort)."""
+	if not have_openai_key() or httpx is None:
+		return
+	try:
+		_client()
+		if _HTTPX_CLIENT is not None:
+			_HTTPX_CLIENT.head("https://api.openai.com/v1/models")
+	except Exception:
+		pass
+
+
+# Exponential backoff with jitter: 1s doubling to a 60s cap, so retry storms
+# from co-failing sessions do not synchronize. Only transient errors retry;
+# 4xx client errors (bad request, auth) surface immediately.
+_RETRY_BASE = 1.0
+_RETRY_CAP = 60.0
+_MAX_RETRIES = 6
+
+
+def _retryable_errors() -> tuple:
 	try:
-		return OpenAI(timeout=10)
+		import openai
+		return (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError)
 	except Exception:
-		return OpenAI()
+		return ()
 
 
-def _with_retries(func, max_retries: int = 2, delay_seconds: float = 0.7):
+def _retry_delay(e: Exception, attempt: int) -> float:
+	delay = min(_RETRY_CAP, _RETRY_BASE * (2 ** attempt)) * random.uniform(0.5, 1.5)
+	# Honor the server's Retry-After on rate limits when it asks for longer
+	try:
+		retry_after = float(e.response.headers.get("retry-after"))
+		delay = max(delay, retry_after)
+	except Exception:
+		pass
+	return delay
+
+
+def _with_retries(func, max_retries: int = _MAX_RETRIES):
+	retryable = _retryable_errors()
 	for attempt in range(max_retries + 1):
 		try:
 			return func()
 		except Exception as e:
-			LOGGER.warning("LLM call failed (attempt %d/%d): %s", attempt + 1, max_retries + 1, e)
-			if attempt >= max_retries:
+			if (retryable and not isinstance(e, retryable)) or attempt >= max_retries:
 				raise
-			time.sleep(delay_seconds)
+			delay = _retry_delay(e, attempt)
+			LOGGER.warning(
+				"LLM call failed (attempt %d/%d), retrying in %.1fs: %s",
+				attempt + 1, max_retries + 1, delay, e,
+			)
+			time.sleep(delay)
+
+
+# Anchor the cache next to the app like logs/docs, not the launch CWD
+_BASE_DIR = Path(__file__).resolve().parent.parent
+
+try:
+	_RESPONSE_CACHE: LLMCache | None = LLMCache(_BASE_DIR / ".cache" / "llm" / "responses.sqlite3")
+except Exception as _e:  # e.g. read-only filesystem; run uncached
+	LOGGER.warning("LLM response cache unavailable: %s", _e)
+	_RESPONSE_CACHE = None
+
+
+async def _awith_retries(coro_factory, max_retries: int = _MAX_RETRIES):
+	retryable = _retryable_errors()
+	for attempt in range(max_retries + 1):
+		try:
+			return await coro_factory()
+		except Exception as e:
+			if (retryable and not isinstance(e, retryable)) or attempt >= max_retries:
+				raise
+			delay = _retry_delay(e, attempt)
+			LOGGER.warning(
+				"LLM call failed (attempt %d/%d), retrying in %.1fs: %s",
+				attempt + 1, max_retries + 1, delay, e,
+			)
+			await asyncio.sleep(delay)
+
+
+def _cached_chat(client, **kwargs) -> str:
+	"""Run a chat completion through the persistent response cache.
+
+	Deterministic requests (temperature=0) hit the sqlite-backed LLMCache
+	first; misses call the API with retries and populate the cache. Returns
+	the response message content.
+	"""
+	key = None
+	if _RESPONSE_CACHE is not None:
+		key = LLMCache.cache_key(
+			kwargs.get("model", ""), kwargs.get("messages"), kwargs.get("temperature", 0.0)
+		)
+		if key is not None:
+			hit = _RESPONSE_CACHE.get(key)
+			if hit is not None:
+				return hit
+	resp = _with_retries(lambda: client.chat.completions.create(**kwargs))
+	text = resp.choices[0].message.content or ""
+	if key is not None:
+		_RESPONSE_CACHE.set(key, text)
+	return text
+
+
+@lru_cache(maxsize=4)
+def _header_map_system(canon_keys: frozenset) -> str:
+	"""Invariant header-mapping preamble, byte-identical between calls.
+
+	Instructions and the sorted canonical-keys list lead the prompt so the
+	provider's automatic prefix caching gets a stable prefix; only the short
+	unknown-headers list varies, and it goes last in the user turn.
+	"""
+	return (
+		"You are a strict schema mapper. Given the canonical schema keys below and a list of "
+		"unknown headers, map each unknown header to EXACTLY one canonical key or to an empty "
+		"string if not possible. Respond as a JSON object mapping unknown->canonical_or_empty. "
+		"No explanations. Output strictly JSON.\n\n"
+		f"Canonical keys: {json.dumps(sorted(canon_keys))}"
+	)
 
 
 def map_headers_with_llm(unmatched: List[str], truth: Dict) -> Dict[str, str]:
@@ -46,98 +232,381 @@ def map_headers_with_llm(unmatched: List[str], truth: Dict) -> Dict[str, str]:
 	if not have_openai_key() or not unmatched:
 		return {}
 	client = _client()
-	prompt = {
-		"role": "user",
-		"content": (
-			"You are a strict schema mapper. Given a canonical schema keys list and unknown headers, "
-			"map each unknown header to EXACTLY one canonical key or return empty if not possible. "
-			"Respond as a JSON object mapping unknown->canonical_or_empty. No explanations.\n\n"
-			f"Canonical keys: {list(truth.keys())}\n\nUnknown headers: {unmatched}"
-		),
-	}
 	try:
-		resp = _with_retries(lambda: client.chat.completions.create(
+		text = _cached_chat(
+			client,
 			model=MODEL_HEADER,
-			messages=[{"role": "system", "content": "Output strictly JSON."}, prompt],
+			messages=[
+				{"role": "system", "content": _header_map_system(frozenset(truth.keys()))},
+				{"role": "user", "content": f"Unknown headers: {json.dumps(list(unmatched))}"},
+			],
 			temperature=0,
-		))
-		text = resp.choices[0].message.content or "{}"
-		import json
-		obj = json.loads(text)
+			response_format={"type": "json_object"},
+		) or "{}"
+		obj = _loads(text)
 		return {k: str(v) for k, v in obj.items() if isinstance(v, str)}
 	except Exception as e:
 		LOGGER.error("map_headers_with_llm failed: %s", e)
 		return {}
 
 
+_PROPOSAL_CACHE: Dict[str, Dict[str, Dict]] = {}
+
+
+def _proposal_cache_key(headers: List[str], samples: Dict[str, List[str]]) -> str:
+	payload = json.dumps([sorted(headers), samples], sort_keys=True, default=str)
+	return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Invariant schema-proposal instructions; kept in the system message so the
+# prompt prefix stays byte-identical across calls for prefix caching
+_SCHEMA_PROPOSAL_SYSTEM = (
+	"You are a data schema assistant. For each unknown header, propose a canonical key and metadata.\n"
+	"For every header, return an object with keys: canonical, description, example, synonyms (list), header_regex.\n"
+	"- canonical: concise snake_case name.\n"
+	"- description: short phrase explaining the field.\n"
+	"- example: realistic example, ideally from samples.\n"
+	"- synonyms: 5-12 likely header variants.\n"
+	"- header_regex: case-insensitive regex that matches typical header spellings (anchor with ^ and $).\n"
+	"Respond STRICTLY as JSON mapping source_header -> object, with required keys only. No extra text."
+)
+
+
+def schema_proposal_messages(headers: List[str], snippets: Dict[str, List[str]]) -> List[Dict[str, str]]:
+	"""Build the chat messages for a schema-proposal request (shared by the
+	synchronous path and the Batch API path)."""
+	return [
+		{"role": "system", "content": _SCHEMA_PROPOSAL_SYSTEM},
+		{"role": "user", "content": f"Unknown headers: {headers}\n\nSample values: {json.dumps(snippets)}"},
+	]
+
+
+def normalize_proposal_obj(obj: Dict) -> Dict[str, Dict]:
+	"""Shape-guard a parsed proposal response into the schema-truth entry form."""
+	clean: Dict[str, Dict] = {}
+	for src, meta in obj.items():
+		if isinstance(meta, dict):
+			clean[src] = {
+				"header": meta.get("canonical"),
+				"description": meta.get("description"),
+				"example": meta.get("example"),
+				"synonyms": meta.get("synonyms", []),
+				"header_regex": meta.get("header_regex"),
+			}
+	return clean
+
+
+# Prompt payload hygiene: samples are only exemplars, so long free-text
+# values are truncated, duplicates and null-likes dropped; dirty values are
+# capped as well. Every byte here is input tokens on each call.
+_NULLISH = {"", "na", "n/a", "null", "none", "-"}
+_SAMPLE_MAX_CHARS = 60
+_VALUE_MAX_CHARS = 200
+
+
+def _prep_samples(values: List[str], limit: int = 5) -> List[str]:
+	out: List[str] = []
+	seen = set()
+	for v in values:
+		v = (v or "")[:_SAMPLE_MAX_CHARS].strip()
+		key = v.lower()
+		if key in _NULLISH or key in seen:
+			continue
+		seen.add(key)
+		out.append(v)
+		if len(out) >= limit:
+			break
+	return out
+
+
+# Headers per proposal request: keeps single completions short and lets many
+# chunks run concurrently; one failed chunk no longer loses the whole set
+_PROPOSAL_CHUNK = 15
+
+
+async def _apropose_chunk(client, sem: asyncio.Semaphore, chunk: List[str], snippets: Dict[str, List[str]]) -> Dict[str, Dict]:
+	text = await _acached_chat(
+		client,
+		sem,
+		model=MODEL_HEADER,
+		messages=schema_proposal_messages(chunk, snippets),
+		temperature=0,
+		response_format={"type": "json_object"},
+	) or "{}"
+	return normalize_proposal_obj(_loads(text))
+
+
+def _propose_concurrent(headers: List[str], samples: Dict[str, List[str]]) -> Dict[str, Dict]:
+	chunks = [headers[i:i + _PROPOSAL_CHUNK] for i in range(0, len(headers), _PROPOSAL_CHUNK)]
+
+	async def _run():
+		client = _aclient()
+		try:
+			sem = asyncio.Semaphore(LLM_CONCURRENCY)
+			return await asyncio.gather(
+				*[
+					_apropose_chunk(client, sem, c, {h: _prep_samples(samples.get(h, [])) for h in c})
+					for c in chunks
+				],
+				return_exceptions=True,
+			)
+		finally:
+			await client.close()
+
+	results = asyncio.run(_run())
+	merged: Dict[str, Dict] = {}
+	failed: List[List[str]] = []
+	for chunk, res in zip(chunks, results):
+		if isinstance(res, BaseException):
+			LOGGER.warning("Proposal chunk of %d headers failed: %s", len(chunk), res)
+			failed.append(chunk)
+		else:
+			merged.update(res)
+	# Retry failed chunks once at half size, synchronously
+	for chunk in failed:
+		half = max(1, len(chunk) // 2)
+		for sub in (chunk[i:i + half] for i in range(0, len(chunk), half)):
+			try:
+				text = _cached_chat(
+					_client(),
+					model=MODEL_HEADER,
+					messages=schema_proposal_messages(sub, {h: _prep_samples(samples.get(h, [])) for h in sub}),
+					temperature=0,
+					response_format={"type": "json_object"},
+				) or "{}"
+				merged.update(normalize_proposal_obj(_loads(text)))
+			except Exception as e:
+				LOGGER.error("Proposal retry failed for %d headers: %s", len(sub), e)
+	return merged
+
+
 def propose_schema_for_headers(headers: List[str], samples: Dict[str, List[str]]) -> Dict[str, Dict]:
 	"""Ask model to propose schema entries for new headers.
 	Returns {src_header: {canonical, description, example, synonyms, header_regex}} strictly.
+	Responses are cached per (headers, samples) so Streamlit reruns with the
+	same unmatched set cost no API round-trip; header sets larger than one
+	chunk are split and submitted concurrently.
 	"""
 	if not have_openai_key() or not headers:
 		return {}
+	cache_key = _proposal_cache_key(headers, samples)
+	cached = _PROPOSAL_CACHE.get(cache_key)
+	if cached is not None:
+		return cached
+	if len(headers) > _PROPOSAL_CHUNK and AsyncOpenAI is not None:
+		try:
+			clean = _propose_concurrent(list(headers), samples)
+			_PROPOSAL_CACHE[cache_key] = clean
+			return clean
+		except Exception as e:
+			LOGGER.warning("Concurrent proposal path failed (%s); using one request", e)
 	client = _client()
-	import json as _json
-	snippets = {h: samples.get(h, [])[:5] for h in headers}
-	prompt = {
-		"role": "user",
-		"content": (
-			"You are a data schema assistant. For each unknown header, propose a canonical key and metadata.\n"
-			"For every header, return an object with keys: canonical, description, example, synonyms (list), header_regex.\n"
-			"- canonical: concise snake_case name.\n"
-			"- description: short phrase explaining the field.\n"
-			"- example: realistic example, ideally from samples.\n"
-			"- synonyms: 5-12 likely header variants.\n"
-			"- header_regex: case-insensitive regex that matches typical header spellings (anchor with ^ and $).\n"
-			"Respond STRICTLY as JSON mapping source_header -> object. No extra text.\n\n"
-			f"Unknown headers: {headers}\n\nSample values: {_json.dumps(snippets)}"
-		),
-	}
+	snippets = {h: _prep_samples(samples.get(h, [])) for h in headers}
 	try:
-		resp = _with_retries(lambda: client.chat.completions.create(
+		text = _cached_chat(
+			client,
 			model=MODEL_HEADER,
-			messages=[{"role": "system", "content": "Output strictly JSON with required keys only."}, prompt],
+			messages=schema_proposal_messages(headers, snippets),
 			temperature=0,
-		))
-		text = resp.choices[0].message.content or "{}"
-		obj = _json.loads(text)
-		# Basic shape guard
-		clean: Dict[str, Dict] = {}
-		for src, meta in obj.items():
-			if isinstance(meta, dict):
-				clean[src] = {
-					"header": meta.get("canonical"),
-					"description": meta.get("description"),
-					"example": meta.get("example"),
-					"synonyms": meta.get("synonyms", []),
-					"header_regex": meta.get("header_regex"),
-				}
+			response_format={"type": "json_object"},
+		) or "{}"
+		clean = normalize_proposal_obj(_loads(text))
+		_PROPOSAL_CACHE[cache_key] = clean
 		return clean
 	except Exception as e:
 		LOGGER.error("propose_schema_for_headers failed: %s", e)
 		return {}
 
 
-def clean_value_with_llm(column: str, value: str, description: str = "") -> str | None:
-	"""Ask model for a conservative cleaned value suggestion. Must be same semantic type."""
-	if not have_openai_key() or value is None or value == "":
-		return None
+_CLEAN_BATCH_SYSTEM = (
+	"You clean tabular values that failed validation. Given a column name, a description and a "
+	"JSON list of raw values, respond STRICTLY with a JSON array of conservative cleaned values, "
+	"the same length and order as the input, using an empty string when unsure. Do not "
+	"hallucinate. No extra text."
+)
+
+
+def clean_values_with_llm(column: str, values: List[str], description: str = "") -> List[str | None]:
+	"""Clean a list of failing values for one column in a single request.
+
+	The static instructions live in the system message so the provider's
+	automatic prompt caching can reuse that prefix across calls; only the
+	volatile column/values payload varies per request. The response must be a
+	JSON array of the same length and order as the input; on a malformed or
+	mismatched response, falls back to per-item clean_value_with_llm calls.
+	"""
+	values = list(values)
+	if not have_openai_key() or not values:
+		return [None] * len(values)
+	client = _client()
+	payload = json.dumps({
+		"column": column,
+		"description": description,
+		"values": [v[:_VALUE_MAX_CHARS] for v in values],
+	})
+	try:
+		text = _cached_chat(
+			client,
+			model=MODEL_CLEAN,
+			messages=[
+				{"role": "system", "content": _CLEAN_BATCH_SYSTEM},
+				{"role": "user", "content": payload},
+			],
+			temperature=0,
+		) or "[]"
+		out = _loads(text)
+		if isinstance(out, list) and len(out) == len(values):
+			return [(v.strip() or None) if isinstance(v, str) else None for v in out]
+		LOGGER.warning(
+			"clean_values_with_llm: response shape mismatch (%s items for %d values)",
+			len(out) if isinstance(out, list) else type(out).__name__,
+			len(values),
+		)
+	except Exception as e:
+		LOGGER.error("clean_values_with_llm failed: %s", e)
+	return [clean_value_with_llm(column, v, description) for v in values]
+
+
+def clean_values_batch(column: str, values: List[str], description: str = "") -> Dict[str, str | None]:
+	"""Batch-clean distinct failing values; returns {raw_value: cleaned_or_None}."""
+	values = list(values)
+	return dict(zip(values, clean_values_with_llm(column, values, description)))
+
+
+async def _acached_chat(client, sem: asyncio.Semaphore, **kwargs) -> str:
+	"""Async twin of _cached_chat, bounded by the shared semaphore."""
+	key = None
+	if _RESPONSE_CACHE is not None:
+		key = LLMCache.cache_key(
+			kwargs.get("model", ""), kwargs.get("messages"), kwargs.get("temperature", 0.0)
+		)
+		if key is not None:
+			hit = _RESPONSE_CACHE.get(key)
+			if hit is not None:
+				return hit
+	async with sem:
+		resp = await _awith_retries(lambda: client.chat.completions.create(**kwargs))
+	text = resp.choices[0].message.content or ""
+	if key is not None:
+		_RESPONSE_CACHE.set(key, text)
+	return text
+
+
+async def aclean_values_with_llm(
+	client, sem: asyncio.Semaphore, column: str, values: List[str], description: str = ""
+) -> Dict[str, str | None] | None:
+	"""Async variant of clean_values_with_llm; returns None on a bad response."""
+	payload = json.dumps({
+		"column": column,
+		"description": description,
+		"values": [v[:_VALUE_MAX_CHARS] for v in values],
+	})
+	try:
+		text = await _acached_chat(
+			client,
+			sem,
+			model=MODEL_CLEAN,
+			messages=[
+				{"role": "system", "content": _CLEAN_BATCH_SYSTEM},
+				{"role": "user", "content": payload},
+			],
+			temperature=0,
+		) or "[]"
+		out = _loads(text)
+		if isinstance(out, list) and len(out) == len(values):
+			return dict(zip(values, [(v.strip() or None) if isinstance(v, str) else None for v in out]))
+	except Exception as e:
+		LOGGER.error("aclean_values_with_llm failed for %s: %s", column, e)
+	return None
+
+
+def clean_value_batches(requests: List[Tuple[str, List[str], str]]) -> List[Dict[str, str | None]]:
+	"""Run several (column, values, description) batch cleans concurrently.
+
+	Independent column batches overlap their round-trip latency through
+	AsyncOpenAI + asyncio.gather, bounded by LLM_CONCURRENCY. Falls back to
+	sequential synchronous calls when the async client is unavailable, and
+	re-runs any failed batch synchronously.
+	"""
+	requests = [(c, list(v), d) for c, v, d in requests]
+	if not requests:
+		return []
+	if not have_openai_key() or AsyncOpenAI is None or len(requests) == 1:
+		return [clean_values_batch(c, v, d) for c, v, d in requests]
+
+	async def _run():
+		client = _aclient()
+		try:
+			sem = asyncio.Semaphore(LLM_CONCURRENCY)
+			return await asyncio.gather(
+				*[aclean_values_with_llm(client, sem, c, v, d) for c, v, d in requests]
+			)
+		finally:
+			await client.close()
+
+	try:
+		results = asyncio.run(_run())
+	except Exception as e:
+		LOGGER.warning("Async batch cleaning unavailable (%s); running sequentially", e)
+		return [clean_values_batch(c, v, d) for c, v, d in requests]
+	return [
+		r if r is not None else clean_values_batch(c, v, d)
+		for r, (c, v, d) in zip(results, requests)
+	]
+
+
+# In-flight coalescing: concurrent callers asking for the same (column,
+# description, value) share one Future instead of firing duplicate requests.
+# The lru_cache above it covers repeats after the first call resolves.
+_INFLIGHT: Dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _clean_value_api(column: str, value: str, description: str) -> str | None:
 	client = _client()
 	prompt = {
 		"role": "user",
 		"content": (
 			"Given a column name and a value that failed validation, suggest a conservative cleaned value. "
 			"Do not hallucinate; if unsure, return empty. Only output the cleaned value.\n\n"
-			f"Column: {column}\nDescription: {description}\nValue: {value}"
+			f"Column: {column}\nDescription: {description}\nValue: {value[:_VALUE_MAX_CHARS]}"
 		),
 	}
 	try:
-		resp = _with_retries(lambda: client.chat.completions.create(
+		text = _cached_chat(
+			client,
 			model=MODEL_CLEAN,
 			messages=[{"role": "system", "content": "Return only the cleaned value, or empty if unsure."}, prompt],
 			temperature=0,
-		))
-		return (resp.choices[0].message.content or "").strip() or None
+		)
+		return text.strip() or None
 	except Exception as e:
 		LOGGER.error("clean_value_with_llm failed: %s", e)
 		return None
+
+
+@lru_cache(maxsize=100_000)
+def clean_value_with_llm(column: str, value: str, description: str = "") -> str | None:
+	"""Ask model for a conservative cleaned value suggestion. Must be same semantic type.
+
+	Memoized on (column, value, description): dirty columns repeat a handful
+	of distinct bad values, so duplicate cells resolve as cache hits instead
+	of API round-trips; concurrent duplicates coalesce onto one in-flight
+	request.
+	"""
+	if not have_openai_key() or value is None or value == "":
+		return None
+	key = (column, description, value)
+	with _INFLIGHT_LOCK:
+		fut = _INFLIGHT.get(key)
+		owner = fut is None
+		if owner:
+			fut = Future()
+			_INFLIGHT[key] = fut
+	if not owner:
+		return fut.result()
+	result = _clean_value_api(column, value, description)
+	fut.set_result(result)
+	with _INFLIGHT_LOCK:
+		_INFLIGHT.pop(key, None)
+	return result
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .llm import MODEL_HEADER, _client, _prep_samples, normalize_proposal_obj, schema_proposal_messages
+
+
+LOGGER = logging.getLogger("llm_batch")
+
+COMPLETION_WINDOW = "24h"
+# Headers per request inside a batch, to keep each completion small
+GROUP_SIZE = 20
+# Above this many unknown headers the Mapper switches to the Batch API
+# (50% token cost, separate rate-limit pool, 24h completion window)
+BATCH_HEADER_THRESHOLD = 200
+
+
+def submit_batch(requests: List[dict]) -> str:
+	"""Upload a JSONL of chat requests and create a Batch job; returns its id.
+
+	Each entry in `requests` must carry `custom_id` and a chat-completions
+	`body` (model, messages, temperature).
+	"""
+	client = _client()
+	lines = [
+		json.dumps({
+			"custom_id": r["custom_id"],
+			"method": "POST",
+			"url": "/v1/chat/completions",
+			"body": r["body"],
+		})
+		for r in requests
+	]
+	with tempfile.NamedTemporaryFile("wb", suffix=".jsonl", delete=False) as f:
+		f.write("\n".join(lines).encode("utf-8"))
+		tmp_path = Path(f.name)
+	try:
+		with tmp_path.open("rb") as fh:
+			uploaded = client.files.create(file=fh, purpose="batch")
+	finally:
+		tmp_path.unlink(missing_ok=True)
+	batch = client.batches.create(
+		input_file_id=uploaded.id,
+		endpoint="/v1/chat/completions",
+		completion_window=COMPLETION_WINDOW,
+	)
+	LOGGER.info("Submitted batch %s with %d requests", batch.id, len(requests))
+	return batch.id
+
+
+def poll_batch(batch_id: str) -> str:
+	"""Return the batch status (validating/in_progress/completed/failed/...)."""
+	return _client().batches.retrieve(batch_id).status
+
+
+def collect_batch(batch_id: str) -> Optional[Dict[str, dict]]:
+	"""Download a completed batch's output as {custom_id: parsed_json_content}.
+
+	Returns None while the batch is still running or has no output file;
+	malformed output lines are logged and skipped.
+	"""
+	client = _client()
+	batch = client.batches.retrieve(batch_id)
+	if batch.status != "completed" or not batch.output_file_id:
+		return None
+	content = client.files.content(batch.output_file_id)
+	out: Dict[str, dict] = {}
+	for line in content.text.splitlines():
+		if not line.strip():
+			continue
+		try:
+			rec = json.loads(line)
+			text = rec["response"]["body"]["choices"][0]["message"]["content"]
+			out[rec["custom_id"]] = json.loads(text)
+		except Exception as e:
+			LOGGER.warning("Skipping malformed batch output line: %s", e)
+	return out
+
+
+def submit_schema_proposal_batch(headers: List[str], samples: Dict[str, List[str]]) -> str:
+	"""Package schema proposals for a large header set as one Batch job."""
+	groups = [headers[i:i + GROUP_SIZE] for i in range(0, len(headers), GROUP_SIZE)]
+	requests = []
+	for i, group in enumerate(groups):
+		snippets = {h: _prep_samples(samples.get(h, [])) for h in group}
+		requests.append({
+			"custom_id": f"hdr:{i}",
+			"body": {
+				"model": MODEL_HEADER,
+				"messages": schema_proposal_messages(group, snippets),
+				"temperature": 0,
+				"response_format": {"type": "json_object"},
+			},
+		})
+	return submit_batch(requests)
+
+
+def collect_schema_proposals(batch_id: str) -> Optional[Dict[str, Dict]]:
+	"""Merge a completed proposal batch back into the usual proposals dict."""
+	results = collect_batch(batch_id)
+	if results is None:
+		return None
+	merged: Dict[str, Dict] = {}
+	for parsed in results.values():
+		if isinstance(parsed, dict):
+			merged.update(normalize_proposal_obj(parsed))
+	return merged
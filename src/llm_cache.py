@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+LOGGER = logging.getLogger("llm_cache")
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+
+
+class LLMCache:
+	"""Exact-match response cache for deterministic (temperature=0) LLM calls.
+
+	Keys are SHA-256 hashes of (model, messages, temperature); values are the
+	raw response text. Backed by a small sqlite file so identical header sets
+	and dirty values resolve without an API round-trip, across Streamlit
+	reruns and across sessions. Calls with temperature > 0 are never cached.
+	"""
+
+	def __init__(self, path: Path, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		self._ttl = ttl_seconds
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(str(path), check_same_thread=False)
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS responses ("
+			"key TEXT PRIMARY KEY, response TEXT, created REAL, expires REAL)"
+		)
+		self._conn.commit()
+		self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+		atexit.register(self._log_stats)
+
+	@staticmethod
+	def cache_key(model: str, messages: Any, temperature: float = 0.0) -> Optional[str]:
+		"""Return a stable key for the request, or None when it is not cacheable."""
+		if temperature and temperature > 0:
+			return None
+		payload = json.dumps(
+			{"model": model, "messages": messages, "temperature": temperature},
+			sort_keys=True,
+			default=str,
+		)
+		return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+	def get(self, key: str) -> Optional[str]:
+		try:
+			with self._lock:
+				row = self._conn.execute(
+					"SELECT response, expires FROM responses WHERE key = ?", (key,)
+				).fetchone()
+		except Exception as e:
+			LOGGER.warning("LLM cache read failed: %s", e)
+			return None
+		if row is None or row[1] < time.time():
+			self.stats["misses"] += 1
+			return None
+		self.stats["hits"] += 1
+		return row[0]
+
+	def set(self, key: str, response: str) -> None:
+		now = time.time()
+		try:
+			with self._lock:
+				self._conn.execute(
+					"INSERT OR REPLACE INTO responses (key, response, created, expires) VALUES (?, ?, ?, ?)",
+					(key, response, now, now + self._ttl),
+				)
+				self._conn.commit()
+		except Exception as e:
+			LOGGER.warning("LLM cache write failed: %s", e)
+
+	def _log_stats(self) -> None:
+		if self.stats["hits"] or self.stats["misses"]:
+			LOGGER.info("LLM cache stats: hits=%d misses=%d", self.stats["hits"], self.stats["misses"])
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 
+LOG_WINDOW = 2000
+
+
 class StreamlitLogHandler(logging.Handler):
 	def __init__(self):
 		super().__init__()
@@ -16,28 +22,47 @@ class StreamlitLogHandler(logging.Handler):
 		except Exception:
 			return
 		msg = self.format(record)
-		logs = st_state.get("log_records", [])
+		# deque(maxlen) keeps the rolling window O(1) per record instead of
+		# re-slicing the full list on every log line
+		logs = st_state.get("log_records")
+		if not isinstance(logs, deque):
+			logs = deque(logs or (), maxlen=LOG_WINDOW)
+			st_state["log_records"] = logs
 		logs.append(msg)
-		# keep a rolling window
-		if len(logs) > 2000:
-			logs = logs[-2000:]
-		st_state["log_records"] = logs
+
+
+_LISTENER: Optional[QueueListener] = None
 
 
 def setup_logging(log_file: Path, level: int = logging.INFO, attach_streamlit: bool = False) -> None:
+	"""Route file logging through a queue so record emission never blocks on
+	disk I/O: loggers enqueue, a background QueueListener thread writes.
+
+	The Streamlit handler stays attached directly to the root logger: its
+	emit is an O(1) in-memory deque append with no I/O, and it must run on
+	the script thread - from the listener thread session_state has no script
+	run context, so records would never reach the real session.
+	"""
+	global _LISTENER
 	log_file.parent.mkdir(parents=True, exist_ok=True)
 	logger = logging.getLogger()
 	logger.setLevel(level)
 
+	formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+
 	# Avoid duplicate handlers on reruns
-	if not any(isinstance(h, RotatingFileHandler) for h in logger.handlers):
+	if not any(isinstance(h, QueueHandler) for h in logger.handlers):
 		file_handler = RotatingFileHandler(str(log_file), maxBytes=1_000_000, backupCount=3, encoding="utf-8")
-		file_handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
-		logger.addHandler(file_handler)
+		file_handler.setFormatter(formatter)
+		log_queue: queue.Queue = queue.Queue(-1)
+		logger.addHandler(QueueHandler(log_queue))
+		_LISTENER = QueueListener(log_queue, file_handler, respect_handler_level=True)
+		_LISTENER.start()
+		atexit.register(_LISTENER.stop)
 
 	if attach_streamlit and not any(isinstance(h, StreamlitLogHandler) for h in logger.handlers):
 		st_handler = StreamlitLogHandler()
-		st_handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
+		st_handler.setFormatter(formatter)
 		logger.addHandler(st_handler)
 
 
@@ -46,3 +71,6 @@ def set_log_level(level: int) -> None:
 	logger.setLevel(level)
 	for h in logger.handlers:
 		h.setLevel(level)
+	if _LISTENER is not None:
+		for h in _LISTENER.handlers:
+			h.setLevel(level)
@@ -1,29 +1,61 @@
 from __future__ import annotations
 
-import re
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
 
-from rapidfuzz.distance.Levenshtein import normalized_similarity
+from rapidfuzz import process as rf_process
+from rapidfuzz.distance import Levenshtein
 
+from .normalize import normalize_header as _normalize_header
 from .schema_truth import SchemaTruth
 from .llm import map_headers_with_llm
 
 
-SEPARATORS_RE = re.compile(r"[\s_\-./]+")
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+@dataclass(slots=True)
+class MapEntry:
+	"""One mapping suggestion per source header.
 
+	Slots keep the per-header footprint to three fields instead of a dict,
+	and downstream code reads plain attributes. to_dict() serves the
+	DataFrame/JSON boundary.
+	"""
 
-def _normalize_header(text: str) -> str:
-	if text is None:
-		return ""
-	lc = text.strip().lower()
-	lc = re.sub(r"\s+", " ", lc)
-	# Preserve semantic hints for symbols before stripping others
-	lc = lc.replace("%", " pct ")
-	lc = lc.replace("#", " num ")
-	# Compact form for similarity
-	compact = NON_ALNUM_RE.sub("", lc)
-	return compact
+	canonical: str | None
+	confidence: float
+	method: str
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {"canonical": self.canonical, "confidence": self.confidence, "method": self.method}
+
+
+def _norm_key_lookup(truth: SchemaTruth) -> Dict[str, str]:
+	lookup = getattr(truth, "norm_key_to_canon", None)
+	if lookup is None:  # plain dict (not loaded via load_schema_truth)
+		lookup = {_normalize_header(k): k for k in truth.keys()}
+	return lookup
+
+
+def _regex_list(truth: SchemaTruth) -> List[Tuple[str, object]]:
+	regexes = getattr(truth, "regex_list", None)
+	if regexes is None:
+		regexes = [
+			(canon, meta.get("_header_re"))
+			for canon, meta in truth.items()
+			if meta.get("_header_re")
+		]
+	return regexes
+
+
+def _flat_synonyms(truth: SchemaTruth) -> Tuple[List[str], List[str]]:
+	choices = getattr(truth, "flat_syn_choices", None)
+	canons = getattr(truth, "flat_syn_canon", None)
+	if choices is None or canons is None:
+		choices, canons = [], []
+		for canon, meta in truth.items():
+			for s in meta.get("_syn_lc", []):
+				choices.append(_normalize_header(s))
+				canons.append(canon)
+	return choices, canons
 
 
 def suggest_mapping(
@@ -31,60 +63,81 @@ def suggest_mapping(
 	truth: SchemaTruth,
 	learned_synonyms: Dict[str, List[str]] | None = None,
 	use_llm: bool = False,
-) -> Tuple[Dict[str, Dict], List[str]]:
+) -> Tuple[Dict[str, MapEntry], List[str]]:
 	learned_synonyms = learned_synonyms or {}
-	result: Dict[str, Dict] = {}
+	result: Dict[str, MapEntry] = {}
 	unmatched: List[str] = []
 
-	# Build lookup of normalized synonym -> canonical
-	syn_to_canon: Dict[str, str] = {}
-	for canon, meta in truth.items():
-		for s in meta.get("_syn_lc", []):
-			syn_to_canon[_normalize_header(s)] = canon
-		# learned/prompted synonyms
-		for s in learned_synonyms.get(canon, []):
+	# Precomputed lookups from load_schema_truth; only the learned/prompted
+	# synonyms need normalizing per call
+	norm_key_to_canon = _norm_key_lookup(truth)
+	regex_list = _regex_list(truth)
+	combined_re = getattr(truth, "combined_re", None)
+	group_to_canon = getattr(truth, "group_to_canon", {})
+	syn_to_canon = dict(getattr(truth, "syn_to_canon", None) or {})
+	if not syn_to_canon:
+		for canon, meta in truth.items():
+			for s in meta.get("_syn_lc", []):
+				syn_to_canon[_normalize_header(s)] = canon
+	for canon, syns in learned_synonyms.items():
+		for s in syns:
 			syn_to_canon[_normalize_header(s)] = canon
 
+	fuzzy_pending: List[Tuple[str, str]] = []
 	for src in source_headers:
 		norm = _normalize_header(src)
 
 		# 1) Exact canonical key match
-		if norm in (_normalize_header(k) for k in truth.keys()):
-			for k in truth.keys():
-				if _normalize_header(k) == norm:
-					result[src] = {"canonical": k, "confidence": 1.00, "method": "canonical"}
-					break
+		canon_exact = norm_key_to_canon.get(norm)
+		if canon_exact:
+			result[src] = MapEntry(canonical=canon_exact, confidence=1.00, method="canonical")
 			continue
 
-		# 2) Regex header match (prefer precise pattern cues like % vs id)
+		# 2) Regex header match (prefer precise pattern cues like % vs id);
+		# one combined-alternation match when available, else the pattern list
 		regex_hit = None
-		for canon, meta in truth.items():
-			re_obj = meta.get("_header_re")
-			if re_obj and re_obj.match(src):
-				regex_hit = canon
-				break
+		if combined_re is not None:
+			m = combined_re.match(src)
+			if m:
+				for gname, val in m.groupdict().items():
+					if val is not None and gname in group_to_canon:
+						regex_hit = group_to_canon[gname]
+						break
+		else:
+			for canon, re_obj in regex_list:
+				if re_obj.match(src):
+					regex_hit = canon
+					break
 		if regex_hit:
-			result[src] = {"canonical": regex_hit, "confidence": 0.90, "method": "regex"}
+			result[src] = MapEntry(canonical=regex_hit, confidence=0.90, method="regex")
 			continue
 
 		# 3) Direct synonym match
 		if norm in syn_to_canon:
-			result[src] = {"canonical": syn_to_canon[norm], "confidence": 0.95, "method": "synonym"}
-			continue
-
-		# 4) Fuzzy tie-breaker on synonyms (deterministic, still cheap)
-		high = (None, 0.0)
-		for canon, meta in truth.items():
-			for s in meta.get("_syn_lc", []):
-				score = normalized_similarity(norm, _normalize_header(s))
-				if score > high[1]:
-					high = (canon, score)
-		if high[0] and high[1] >= 0.85:
-			result[src] = {"canonical": high[0], "confidence": 0.82, "method": "fuzzy"}
+			result[src] = MapEntry(canonical=syn_to_canon[norm], confidence=0.95, method="synonym")
 			continue
 
-		# 5) Unmatched (candidate for LLM)
-		unmatched.append(src)
+		# 4) Defer to the batched fuzzy tie-breaker below
+		fuzzy_pending.append((src, norm))
+
+	# 4) Fuzzy tie-breaker on synonyms: one C-level cdist call over the full
+	# (pending headers x flat synonyms) matrix instead of a Python triple loop
+	if fuzzy_pending:
+		choices, choice_canon = _flat_synonyms(truth)
+		if choices:
+			queries = [norm for _, norm in fuzzy_pending]
+			scores = rf_process.cdist(
+				queries, choices, scorer=Levenshtein.normalized_similarity, workers=-1
+			)
+			for i, (src, _) in enumerate(fuzzy_pending):
+				j = int(scores[i].argmax())
+				if scores[i, j] >= 0.85:
+					result[src] = MapEntry(canonical=choice_canon[j], confidence=0.82, method="fuzzy")
+				else:
+					# 5) Unmatched (candidate for LLM)
+					unmatched.append(src)
+		else:
+			unmatched.extend(src for src, _ in fuzzy_pending)
 
 	# Optional LLM fallback
 	if use_llm and unmatched:
@@ -92,24 +145,26 @@ def suggest_mapping(
 		for src in unmatched:
 			canon = llm_map.get(src)
 			if canon in truth:
-				result[src] = {"canonical": canon, "confidence": 0.70, "method": "llm"}
+				result[src] = MapEntry(canonical=canon, confidence=0.70, method="llm")
 			else:
-				result[src] = {"canonical": None, "confidence": 0.0, "method": "unmapped"}
-		still_unmapped = [s for s in unmatched if not result.get(s) or not result[s].get("canonical")]
+				result[src] = MapEntry(canonical=None, confidence=0.0, method="unmapped")
+		still_unmapped = [s for s in unmatched if not result.get(s) or not result[s].canonical]
 		return result, still_unmapped
 
 	return result, unmatched
 
 
 def apply_mapping_overrides(
-	mapping_result: Dict[str, Dict], overrides: Dict[str, str | None]
-) -> Dict[str, Dict]:
-	new_map: Dict[str, Dict] = {}
-	for src, meta in mapping_result.items():
-		canon = overrides.get(src, meta.get("canonical"))
-		new_map[src] = {
-			"canonical": canon,
-			"confidence": meta.get("confidence", 0.0) if canon == meta.get("canonical") else 1.0,
-			"method": meta.get("method", "suggested") if canon == meta.get("canonical") else "override",
-		}
-	return new_map
+	mapping_result: Dict[str, MapEntry], overrides: Dict[str, str | None]
+) -> Dict[str, MapEntry]:
+	if not overrides:
+		return mapping_result
+	# Single pass; the original canonical is a C-level attribute read
+	return {
+		src: MapEntry(
+			canonical=(canon := overrides.get(src, entry.canonical)),
+			confidence=entry.confidence if canon == entry.canonical else 1.0,
+			method=entry.method if canon == entry.canonical else "override",
+		)
+		for src, entry in mapping_result.items()
+	}
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+
+SEPARATORS_RE = re.compile(r"[\s_\-./]+")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+# ASCII fast path: one translate sweep deletes every non-alphanumeric
+# codepoint below 128; the regex only runs for headers with non-ASCII left
+_STRIP_TABLE = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum()))
+
+
+@lru_cache(maxsize=8192)
+def normalize_header(text: str | None) -> str:
+	if text is None:
+		return ""
+	lc = text.strip().lower()
+	# Preserve semantic hints for symbols before stripping others
+	lc = lc.replace("%", " pct ")
+	lc = lc.replace("#", " num ")
+	# Compact form for similarity
+	compact = lc.translate(_STRIP_TABLE)
+	if not compact.isascii():
+		compact = NON_ALNUM_RE.sub("", compact)
+	return compact
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict
 
+try:  # C-level JSON codec; stdlib remains the fallback
+	import orjson
+except Exception:
+	orjson = None  # type: ignore
+
 
 def load_json_file(path: Path, default: Any = None) -> Any:
 	if not path.exists():
 		return default
+	if orjson is not None:
+		return orjson.loads(path.read_bytes())
 	with path.open("r", encoding="utf-8") as f:
 		return json.load(f)
 
 
 def save_json_file(path: Path, data: Any) -> None:
+	"""Write JSON atomically, skipping the write entirely when unchanged.
+
+	Skipping no-op writes keeps the file mtime stable, so the mtime-keyed
+	caches over schema truth stay warm; the write-then-rename means readers
+	never observe a partially written file after a crash.
+	"""
 	path.parent.mkdir(parents=True, exist_ok=True)
-	with path.open("w", encoding="utf-8") as f:
-		json.dump(data, f, ensure_ascii=False, indent=2)
+	if orjson is not None:
+		payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+	else:
+		payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+	if path.exists():
+		try:
+			if path.read_bytes() == payload:
+				return
+		except OSError:
+			pass
+	tmp = path.with_suffix(path.suffix + ".tmp")
+	tmp.write_bytes(payload)
+	os.replace(tmp, path)
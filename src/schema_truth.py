@@ -1,16 +1,56 @@
 from __future__ import annotations
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from .normalize import normalize_header
 from .persistence import load_json_file
 
+try:  # optional linear-time DFA engine for the combined header regex
+	import re2
+except Exception:
+	re2 = None  # type: ignore
 
-SchemaTruth = Dict[str, Dict]
+
+class SchemaTruth(dict):
+	"""Canonical key -> metadata mapping with lookup tables precomputed at load.
+
+	The tables live as attributes rather than dict entries so truth.keys()
+	stays purely canonical. suggest_mapping consults them instead of
+	re-normalizing every canonical key and synonym on each call.
+	"""
+
+	def __init__(self, data: Dict[str, Dict]) -> None:
+		super().__init__(data)
+		self.norm_key_to_canon: Dict[str, str] = {}
+		self.syn_to_canon: Dict[str, str] = {}
+		self.regex_list: List[Tuple[str, re.Pattern]] = []
+		self.flat_syn_choices: List[str] = []
+		self.flat_syn_canon: List[str] = []
+		self.combined_re = None
+		self.group_to_canon: Dict[str, str] = {}
 
 
 def load_schema_truth(path: Path) -> SchemaTruth:
+	"""Load schema truth with its precomputed tables, memoized per (path, mtime).
+
+	The file mtime participates in the cache key, so edits (including the
+	app's own promotions) invalidate naturally while Streamlit reruns against
+	an unchanged file reuse the compiled regexes and lookup tables.
+	"""
+	try:
+		mtime = os.path.getmtime(path)
+	except OSError:
+		mtime = 0.0
+	return _load_schema_truth_cached(str(path), mtime)
+
+
+@lru_cache(maxsize=8)
+def _load_schema_truth_cached(path_str: str, mtime: float) -> SchemaTruth:
+	path = Path(path_str)
 	data = load_json_file(path, default={})
 	# Normalize synonyms to lowercase for matching
 	for key, meta in data.items():
@@ -22,7 +62,43 @@ def load_schema_truth(path: Path) -> SchemaTruth:
 				meta["_header_re"] = re.compile(pattern)
 			except re.error:
 				meta["_header_re"] = None
-	return data
+
+	truth = SchemaTruth(data)
+	truth.norm_key_to_canon = {normalize_header(k): k for k in data}
+	for canon, meta in data.items():
+		for s in meta.get("_syn_lc", []):
+			norm = normalize_header(s)
+			truth.syn_to_canon[norm] = canon
+			truth.flat_syn_choices.append(norm)
+			truth.flat_syn_canon.append(canon)
+		re_obj = meta.get("_header_re")
+		if re_obj is not None:
+			truth.regex_list.append((canon, re_obj))
+
+	# Fold every header regex into one alternation so step 2 of
+	# suggest_mapping is a single match call; alternative order preserves the
+	# first-pattern-wins precedence of the per-pattern loop
+	if truth.regex_list:
+		combined = "|".join(
+			f"(?P<c{i}>{re_obj.pattern})" for i, (_, re_obj) in enumerate(truth.regex_list)
+		)
+		truth.group_to_canon = {f"c{i}": canon for i, (canon, _) in enumerate(truth.regex_list)}
+		truth.combined_re = _compile_combined(combined)
+	return truth
+
+
+def _compile_combined(pattern: str):
+	if re2 is not None:
+		try:
+			return re2.compile(pattern)
+		except Exception:
+			pass
+	try:
+		return re.compile(pattern)
+	except re.error:
+		# e.g. colliding group names across source patterns; callers fall back
+		# to the per-pattern list
+		return None
 
 
 def canonical_keys(truth: SchemaTruth) -> List[str]: